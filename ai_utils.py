@@ -1,10 +1,18 @@
 import os
-import json
-import httpx
 import asyncio
 from pydantic import BaseModel
 from typing import List, Optional
-import unicodedata
+
+from src.services.llm_client import llm_client
+from src.services.llm_cache import response_cache, make_cache_key
+from src.services.schema_cleaner import cleaning_model
+from src.services.prompt_builder import prompt_builder, schema_prompt, RESUME_SCHEMA
+from src.services.sections import SECTION_OUTPUTS, section_keys, split_sections, merge_sections
+
+MODEL = "nvidia/nemotron-3-nano-30b-a3b:free"
+
+# Certifications stay plain strings here (see GenAIEnhanceResponse below)
+AI_RESUME_SCHEMA = {**RESUME_SCHEMA, "certifications": ["str"]}
 
 # --- 1. Define Data Models (Copied from your schemas) ---
 class ContactInfo(BaseModel):
@@ -47,28 +55,8 @@ class GenAIEnhanceResponse(BaseModel):
 
 # --- 2. Helper Functions ---
 
-def sanitize_text_for_pdf(text: str) -> str:
-    if not text:
-        return ""
-    # Standardize characters
-    replacements = {
-        "\u2013": "-", "\u2014": "-", "\u201c": '"', "\u201d": '"', 
-        "\u2018": "'", "\u2019": "'", "\u2022": "*"
-    }
-    for char, rep in replacements.items():
-        text = text.replace(char, rep)
-    # Normalize to ASCII
-    return unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
-
-def clean_data_recursive(data):
-    """Recursively cleans strings in the JSON data."""
-    if isinstance(data, str):
-        return sanitize_text_for_pdf(data)
-    elif isinstance(data, list):
-        return [clean_data_recursive(item) for item in data]
-    elif isinstance(data, dict):
-        return {k: clean_data_recursive(v) for k, v in data.items()}
-    return data
+# Validates the model's JSON and sanitizes every string for the PDF in one pass
+CleanResponse = cleaning_model(GenAIEnhanceResponse, lenient=True)
 
 # --- 3. Main AI Functions ---
 
@@ -81,21 +69,8 @@ async def enhance_resume_ai(resume_text: str, job_description: str):
     if not api_key:
         return {"error": "Missing OPENROUTER_API_KEY in Secrets."}
 
-    system_prompt = (
-        "You are an expert resume writer. "
-        "Return ONLY valid JSON in this exact structure:\n"
-        "{\n"
-        '  "contact": {"name": "", "email": "", "phone": "", "linkedin": "", "github": ""},\n'
-        '  "summary": "",\n'
-        '  "education": [{"institution": "", "location": "", "degree": "", "period": ""}],\n'
-        '  "experience": [{"company": "", "title": "", "location": "", "period": "", "bullets": [""]}],\n'
-        '  "projects": [{"name": "", "tech_stack": [""], "period": "", "bullets": [""]}],\n'
-        '  "skills": ["string"],\n'
-        '  "technical_skills": ["string"],\n'
-        '  "soft_skills": ["string"],\n'
-        '  "certifications": ["string"]\n'
-        "}"
-    )
+    system_prompt = schema_prompt(AI_RESUME_SCHEMA)
+    resume_text = prompt_builder.compact_text(resume_text)
 
     user_prompt = (
         f"RESUME:\n{resume_text}\n\n"
@@ -103,67 +78,164 @@ async def enhance_resume_ai(resume_text: str, job_description: str):
         "Improve the resume to match the job description. Return JSON only."
     )
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
     headers = {
         "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
         "HTTP-Referer": "https://streamlit.io", 
         "X-Title": "AI Resume Builder",
     }
     payload = {
-        "model": "nvidia/nemotron-3-nano-30b-a3b:free",
+        "model": MODEL,
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
     }
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(url, headers=headers, json=payload)
-            if response.status_code != 200:
-                return {"error": f"API Error {response.status_code}: {response.text}"}
-            
-            data = response.json()
-            raw_content = data["choices"][0]["message"]["content"]
-            
-            # Parse JSON
-            parsed = json.loads(raw_content)
-            
-            # Clean text for PDF safety
-            cleaned = clean_data_recursive(parsed)
-            return cleaned
+    # Reruns with the same resume + JD reuse the previous enhancement
+    cache_key = make_cache_key(MODEL, system_prompt, resume_text, job_description)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        response = await llm_client.post(payload, headers=headers)
+        if response.status_code != 200:
+            return {"error": f"API Error {response.status_code}: {response.text}"}
+        
+        data = response.json()
+        raw_content = data["choices"][0]["message"]["content"]
+        
+        # Parse JSON and clean text for PDF safety in one pass
+        cleaned = CleanResponse.model_validate_json(raw_content).model_dump()
+        response_cache.set(cache_key, cleaned)
+        return cleaned
+
+    except Exception as e:
+        return {"error": f"Connection or Parsing Error: {str(e)}"}
+
+async def enhance_resume_sections_ai(profile: dict, job_description: str, previous: dict = None):
+    """
+    Section-granular version of enhance_resume_ai for the structured profile.
 
-        except Exception as e:
-            return {"error": f"Connection or Parsing Error: {str(e)}"}
+    Each section (see sections.SECTION_INPUTS) is keyed on its own content
+    plus the job description hash. Sections whose key matches `previous`
+    or the response cache are reused; the LLM is only asked for the rest.
 
-async def generate_cover_letter_ai(resume_text: str, job_description: str):
-    """
-    Generates a cover letter.
-    Replaces the 'call_openrouter_for_cover_letter' endpoint.
+    Returns (enhanced, sections): pass `sections` back as `previous` on the
+    next call. On failure enhanced is {"error": ...} and sections is previous.
     """
     api_key = os.getenv("OPENROUTER_API_KEY")
     if not api_key:
-        return "Error: Missing API Key"
+        return {"error": "Missing OPENROUTER_API_KEY in Secrets."}, previous
+
+    previous = previous or {}
+    keys = section_keys(profile, job_description, MODEL)
+    sections = {}
+    for name, key in keys.items():
+        if name in previous and previous[name]["key"] == key:
+            sections[name] = {"key": key, "output": previous[name]["output"], "source": "previous"}
+            continue
+        cached = response_cache.get(key)
+        if cached is not None:
+            sections[name] = {"key": key, "output": cached, "source": "cache"}
+
+    stale = [name for name in keys if name not in sections]
+    if stale:
+        out_keys = [k for name in stale for k in SECTION_OUTPUTS[name]]
+        system_prompt = schema_prompt({k: AI_RESUME_SCHEMA[k] for k in out_keys})
+        # Whole profile as context, but only the stale sections are written
+        user_prompt = (
+            f"RESUME:\n{prompt_builder.profile_text(profile)}\n\n"
+            f"JOB DESCRIPTION:\n{job_description}\n\n"
+            f"Improve only these parts of the resume to match the job description: {', '.join(out_keys)}. "
+            "Return JSON only."
+        )
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "HTTP-Referer": "https://streamlit.io",
+            "X-Title": "AI Resume Builder",
+        }
+        payload = {
+            "model": MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+
+        try:
+            response = await llm_client.post(payload, headers=headers)
+            if response.status_code != 200:
+                return {"error": f"API Error {response.status_code}: {response.text}"}, previous
+
+            raw_content = response.json()["choices"][0]["message"]["content"]
+            # exclude_unset: sections the model skipped stay missing rather than empty
+            fresh = split_sections(CleanResponse.model_validate_json(raw_content).model_dump(exclude_unset=True))
+        except Exception as e:
+            return {"error": f"Connection or Parsing Error: {str(e)}"}, previous
+
+        for name in stale:
+            if name in fresh:
+                response_cache.set(keys[name], fresh[name])
+                sections[name] = {"key": keys[name], "output": fresh[name], "source": "llm"}
+            else:
+                # Model skipped it: empty for now, retried on the next call
+                empty = {k: "" if k == "summary" else {} if k == "contact" else [] for k in SECTION_OUTPUTS[name]}
+                sections[name] = {"key": None, "output": empty, "source": "llm"}
+
+    enhanced = merge_sections({name: s["output"] for name, s in sections.items()})
+    return enhanced, sections
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
+def _cover_letter_request(api_key: str, resume_text: str, job_description: str):
     headers = {
         "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
     }
     payload = {
-        "model": "nvidia/nemotron-3-nano-30b-a3b:free",
+        "model": MODEL,
         "messages": [
             {"role": "system", "content": "You are an expert cover letter writer. Return ONLY the text."},
             {"role": "user", "content": f"RESUME:\n{resume_text}\n\nJOB:\n{job_description}\n\nWrite a cover letter."},
         ],
     }
+    return payload, headers
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(url, headers=headers, json=payload)
-            if response.status_code == 200:
-                return response.json()["choices"][0]["message"]["content"]
-            return f"Error {response.status_code}: {response.text}"
-        except Exception as e:
-            return f"Error: {str(e)}"
\ No newline at end of file
+async def generate_cover_letter_ai(resume_text: str, job_description: str):
+    """
+    Generates a cover letter.
+    Replaces the 'call_openrouter_for_cover_letter' endpoint.
+    """
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        return "Error: Missing API Key"
+
+    payload, headers = _cover_letter_request(api_key, resume_text, job_description)
+
+    try:
+        response = await llm_client.post(payload, headers=headers)
+        if response.status_code == 200:
+            return response.json()["choices"][0]["message"]["content"]
+        return f"Error {response.status_code}: {response.text}"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+class CoverLetterError(Exception):
+    """The cover letter stream failed; raised after any text already yielded."""
+
+
+async def stream_cover_letter_ai(resume_text: str, job_description: str):
+    """
+    Streams the cover letter token by token (for st.write_stream).
+    Errors are raised as CoverLetterError, never mixed into the text, so a
+    failure after some tokens is not mistaken for part of the letter.
+    """
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        raise CoverLetterError("Missing API Key")
+
+    payload, headers = _cover_letter_request(api_key, resume_text, job_description)
+
+    try:
+        async for delta in llm_client.stream(payload, headers=headers):
+            yield delta
+    except Exception as e:
+        raise CoverLetterError(str(e)) from e
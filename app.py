@@ -1,5 +1,7 @@
-import asyncio
-from ai_utils import enhance_resume_ai, generate_cover_letter_ai
+from src.services.llm_client import run_sync, iter_sync
+from ai_utils import CoverLetterError, enhance_resume_sections_ai, generate_cover_letter_ai, stream_cover_letter_ai
+from src.services.pipeline import run_pipeline
+from src.services.prompt_builder import prompt_builder
 import requests
 import streamlit as st
 from reportlab.lib.pagesizes import letter
@@ -10,7 +12,9 @@ from reportlab.lib.enums import TA_LEFT, TA_CENTER
 import io
 import json
 from src.services.portfolio import generate_portfolio_html
-from pdf_generator import ResumePDFGenerator, ResumeDOCXGenerator
+from src.services.compress import output_optimizer
+from pdf_generator import resume_pdf_generator, resume_docx_generator
+from src.services.render_cache import render_cache
 import streamlit as st
 import requests
 from streamlit_pdf_viewer import pdf_viewer
@@ -449,59 +453,80 @@ with tab_basic:
 
 
     # ACTION BUTTONS
-    c1, c2, c3 = st.columns(3)
+    c1, c2, c3, c4 = st.columns(4)
     with c1:
         gen_resume = st.button(" Generate Resume", use_container_width=True)
     with c2:
         gen_portfolio = st.button(" Generate Portfolio", use_container_width=True)
     with c3:
         gen_cover = st.button(" Generate Cover Letter", use_container_width=True)
+    with c4:
+        gen_all = st.button(" Generate Everything", use_container_width=True)
 
     # Build resume_text when any action is requested
-    if gen_resume or gen_portfolio or gen_cover:
-        resume_text = f"""
-{name}
-{email} | {phone}
-LinkedIn: {linkedin}
-GitHub: {github}
-
-Summary
-{summary}
-
-Education
-{education}
-
-Experience
-{experiences}
-
-Project 
-{projects}
-
-Technical Skill
-{technical_skills if technical_skills else "Not provided"}
-
-Soft skill
-{soft_skills if soft_skills else "Not provided"}
-
-Certifications
-{certifications}
-""".strip()
+    if gen_resume or gen_portfolio or gen_cover or gen_all:
+        profile = {
+            "name": name,
+            "email": email,
+            "phone": phone,
+            "linkedin": linkedin,
+            "github": github,
+            "summary": summary,
+            "education": education,
+            "experience": experiences,
+            "projects": projects,
+            "skills": {"technical": technical_skills, "soft": soft_skills},
+            "certifications": certifications,
+        }
+        # Compact canonical text: no dict reprs, no empty rows, no repeated lines
+        resume_text = prompt_builder.profile_text(profile)
+        # Sections enhanced last time; unchanged ones are not sent to the LLM again
+        previous_sections = st.session_state.get("enhanced_sections")
 #=============================================================================
         # Basic validation
         if not name or not email or not job_description.strip():
             st.error("Please fill at least Name, Email, and Job Description.")
         else:
+            # EVERYTHING: resume and cover letter run concurrently in one pipeline
+            if gen_all:
+                with st.spinner("Generating resume, portfolio and cover letter..."):
+                    results, timings = run_sync(run_pipeline(
+                        enhance=lambda: enhance_resume_sections_ai(profile, job_description, previous_sections),
+                        cover_letter=lambda: generate_cover_letter_ai(resume_text, job_description),
+                    ))
+                (data, sections), letter = results["enhanced"], results["cover_letter"]
+
+                if "error" in data:
+                    st.error(data["error"])
+                else:
+                    st.session_state["resume_data"] = data
+                    st.session_state["enhanced_sections"] = sections
+                if "Error" in letter:
+                    st.error(letter)
+                else:
+                    st.session_state["cover_letter"] = letter
+                if "error" not in data and "Error" not in letter:
+                    st.success("Resume, portfolio and cover letter generated. Check the other tabs.")
+                st.caption(
+                    " | ".join(f"{stage}: {t['duration_ms'] / 1000:.1f}s" for stage, t in timings.items())
+                )
+
             # RESUME
             if gen_resume:
                 with st.spinner("Generating enhanced resume..."):
-                    # Call AI directly using asyncio
-                    data = asyncio.run(enhance_resume_ai(resume_text, job_description))
+                    # Only sections that changed since the last run go to the AI
+                    data, sections = run_sync(enhance_resume_sections_ai(profile, job_description, previous_sections))
 
                     if "error" in data:
                         st.error(data["error"])
                     else:
                         # Store all AI data in session state
                         st.session_state["resume_data"] = data
+                        st.session_state["enhanced_sections"] = sections
+                        st.caption(
+                            "Regenerated: "
+                            + (", ".join(n for n, s in sections.items() if s["source"] == "llm") or "none")
+                        )
                         # We don't need to manually set individual keys like 'ai_contact' 
                         # because your PDF generator reads from 'resume_data' now.
                         st.success("Resume generated. Check the 📄 Resume tab.")
@@ -512,25 +537,24 @@ Certifications
                 # If resume data doesn't exist yet, we generate it.
                 if not st.session_state.get("resume_data"):
                      with st.spinner("Generating resume data for portfolio..."):
-                        data = asyncio.run(enhance_resume_ai(resume_text, job_description))
+                        data, sections = run_sync(
+                            enhance_resume_sections_ai(profile, job_description, previous_sections)
+                        )
                         if "error" in data:
                             st.error(data["error"])
                         else:
                             st.session_state["resume_data"] = data
+                            st.session_state["enhanced_sections"] = sections
                             st.success("Portfolio ready! Check the 🌐 Portfolio tab.")
                 else:
                     st.success("Portfolio is ready! Check the 🌐 Portfolio tab.")
 
             # COVER LETTER GENERATION
             if gen_cover:
-                with st.spinner("Generating cover letter..."):
-                    letter = asyncio.run(generate_cover_letter_ai(resume_text, job_description))
-                    
-                    if "Error" in letter:
-                        st.error(letter)
-                    else:
-                        st.session_state["cover_letter"] = letter
-                        st.success("Cover letter generated. Check the ✉️ Cover Letter tab.")
+                # Streamed into the Cover Letter tab below as tokens arrive
+                st.session_state["cover_letter_request"] = (resume_text, job_description)
+                st.session_state.pop("cover_letter", None)
+                st.success("Cover letter is being written. Check the ✉️ Cover Letter tab.")
 # ========== RESUME TAB ============
 with tab_resume:
     st.subheader("📄 AI-Enhanced Resume")
@@ -544,36 +568,20 @@ with tab_resume:
         st.warning("⚠️ Please go to the 'Basic' tab and fill in your Name and Email first.")
         st.stop()
         
-    # 3. Build the Text Payload for the AI
-    # We combine what you typed in the tabs to send to the AI
-    resume_text_payload = f"""
-    Name: {basic.get('name')}
-    Email: {basic.get('email')}
-    Phone: {basic.get('phone')}
-    LinkedIn: {basic.get('linkedin')}
-    
-    Summary:
-    {basic.get('summary')}
-    
-    Experience:
-    {st.session_state.experience}
-    
-    Projects:
-    {st.session_state.projects}
-    
-    Education:
-    {st.session_state.education}
-    
-    Skills:
-    {st.session_state.skills}
-    """
-
-    # 4. Generate AI Data (Only if not already done or forced)
+    # 3. Generate AI Data (Only if not already done or forced)
     #if st.button("✨ Generate AI Resume"):
     #   if not job_desc:
     #        st.error("❌ Please provide a Job Description in the 'Basic' tab first.")
     #    else:
     #        with st.spinner("🤖 AI is enhancing your resume..."):
+    #            # We combine what you typed in the tabs to send to the AI (only when sending)
+    #            resume_text_payload = prompt_builder.profile_text({
+    #                **basic,
+    #                "experience": st.session_state.experience,
+    #                "projects": st.session_state.projects,
+    #                "education": st.session_state.education,
+    #                "skills": st.session_state.skills,
+    #            })
     #            try:
     #                response = requests.post(
     #                    f"{API_BASE}/genai/enhance",
@@ -593,7 +601,7 @@ with tab_resume:
     #                # This catches any other generic errors
     #                st.error(f"❌ An error occurred: {e}")
 
-    # 5. Prepare Data for PDF (Merge AI Output + Manual Input)
+    # 4. Prepare Data for PDF (Merge AI Output + Manual Input)
     # If AI data exists, we use it. Otherwise, we fall back to manual input.
     ai_data = st.session_state.resume_data or {}
     
@@ -633,16 +641,15 @@ with tab_resume:
 # BUILD PORTFOLIO DATA (REQUIRED)
 # ============================
 
-    # 6. PDF Preview & Download
+    # 5. PDF Preview & Download
     # This section replaces the JSON view
     if final_resume_data["name"]:
         import base64
-        from pdf_generator import ResumePDFGenerator, ResumeDOCXGenerator
-        
-        # Generate PDF Bytes
-        pdf_gen = ResumePDFGenerator()
-        pdf_buffer = pdf_gen.generate_pdf(final_resume_data)
-        pdf_bytes = pdf_buffer.getvalue()
+        # Generate PDF Bytes; reruns with unchanged resume data reuse the cached render
+        # (the preview needs the PDF anyway, so the download button shares these bytes)
+        pdf_bytes = render_cache.get_or_render(
+            "pdf", final_resume_data, lambda d: resume_pdf_generator.generate_pdf(d).getvalue()
+        )
         b64_pdf = base64.b64encode(pdf_bytes).decode('utf-8')
 
         # Display PDF
@@ -661,15 +668,23 @@ with tab_resume:
                 use_container_width=True
             )
         with c2:
-            docx_gen = ResumeDOCXGenerator()
-            docx_buffer = docx_gen.generate_docx(final_resume_data)
-            st.download_button(
-                label="⬇️ Download Word",
-                data=docx_buffer.getvalue(),
-                file_name=f"{final_resume_data['name']}_Resume.docx",
-                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                use_container_width=True
-            )
+            # Word is built lazily: in a background thread, or on click if that
+            # has not finished yet. Reruns never wait for python-docx.
+            render_docx = lambda d: resume_docx_generator.generate_docx(d).getvalue()
+            docx_bytes = render_cache.peek("docx", final_resume_data)
+            if docx_bytes is None and st.button("📝 Prepare Word file", use_container_width=True):
+                with st.spinner("Building Word file..."):
+                    docx_bytes = render_cache.get_or_render("docx", final_resume_data, render_docx)
+            if docx_bytes is not None:
+                st.download_button(
+                    label="⬇️ Download Word",
+                    data=docx_bytes,
+                    file_name=f"{final_resume_data['name']}_Resume.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    use_container_width=True
+                )
+            else:
+                render_cache.prefetch("docx", final_resume_data, render_docx)
 
 #=====build portfolio data function=====
 def build_portfolio_data(resume_data):
@@ -734,8 +749,14 @@ with tab_portfolio:
     else:
         p = st.session_state["portfolio_data"]
         
-        # Generate and display HTML
-        portfolio_html = generate_portfolio_html(p)
+        # Generate, minify and display HTML
+        raw_html = generate_portfolio_html(p)
+        portfolio_html = output_optimizer.minify(raw_html)
+        sizes = output_optimizer.report(raw_html, {"minified": portfolio_html})
+        st.caption(
+            f"Page size: {sizes['raw'] / 1024:.0f} KB, minified {sizes['minified']['bytes'] / 1024:.0f} KB "
+            f"(-{sizes['minified']['saved_pct']}%)"
+        )
         st.download_button(
             label="⬇️ Download Portfolio Website",
             data=portfolio_html,
@@ -743,13 +764,26 @@ with tab_portfolio:
             mime="text/html",
             use_container_width=True
         )
-        st.components.v1.html(portfolio_html, height=1200, scrolling=True)
+        st.components.v1.html(portfolio_html.decode("utf-8"), height=1200, scrolling=True)
 
 
 # ========== COVER LETTER TAB ==========
 with tab_cover:
     st.subheader("4. Cover Letter")
 
+    pending = st.session_state.pop("cover_letter_request", None)
+    if pending:
+        stream_box = st.empty()
+        try:
+            with stream_box.container():
+                letter = st.write_stream(iter_sync(stream_cover_letter_ai(*pending)))
+        except CoverLetterError as e:
+            stream_box.empty()  # drop the partial text
+            st.error(f"Error: {e}")
+        else:
+            stream_box.empty()  # replaced by the editable text area below
+            st.session_state["cover_letter"] = letter.strip()
+
     if "cover_letter" not in st.session_state:
         st.info("Generate a cover letter from the ✏️ Input tab to see it here.")
     else:
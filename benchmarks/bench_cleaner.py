@@ -0,0 +1,105 @@
+"""
+Schema-driven cleaner vs. the parse -> clean -> build passes it replaced.
+
+    python benchmarks/bench_cleaner.py
+
+legacy API:       json.loads, clean_list copies of every item dict, then
+                  GenAIEnhanceResponse(...) (main.parse_resume_content before)
+legacy Streamlit: json.loads + clean_data_recursive (ai_utils before)
+cleaner:          CleanEnhanceResponse.model_validate_json (one pass)
+
+Reports best-of-5 time per resume, tracemalloc peak and the blocks still
+held by the result.
+"""
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bench_sanitize import legacy_backend, legacy_recursive, make_resume  # noqa: E402
+
+from src.backend.models.schemas import ContactInfo, GenAIEnhanceResponse  # noqa: E402
+from src.services.schema_cleaner import cleaning_model  # noqa: E402
+
+CleanEnhanceResponse = cleaning_model(GenAIEnhanceResponse, skip=("certifications",), lenient=True)
+
+
+def legacy_api(raw_content):
+    parsed = json.loads(raw_content)
+
+    def clean_list(items, fields):
+        cleaned = []
+        for item in items:
+            new_item = item.copy()
+            for field in fields:
+                if field in new_item and isinstance(new_item[field], str):
+                    new_item[field] = legacy_backend(new_item[field])
+                elif field in new_item and isinstance(new_item[field], list):
+                    new_item[field] = [legacy_backend(s) for s in new_item[field]]
+            cleaned.append(new_item)
+        return cleaned
+
+    contact = parsed.get("contact", {}) or {}
+    clean_contact = {k: legacy_backend(v) if isinstance(v, str) else v for k, v in contact.items()}
+    return GenAIEnhanceResponse(
+        contact=ContactInfo(
+            name=clean_contact.get("name", ""),
+            email=clean_contact.get("email", ""),
+            phone=clean_contact.get("phone"),
+            location=clean_contact.get("location"),
+            linkedin=clean_contact.get("linkedin"),
+            github=clean_contact.get("github"),
+        ),
+        summary=legacy_backend(parsed.get("summary", "")),
+        education=clean_list(parsed.get("education", []), ["institution", "location", "degree", "period"]),
+        experience=clean_list(parsed.get("experience", []), ["company", "title", "location", "period", "bullets"]),
+        projects=clean_list(parsed.get("projects", []), ["name", "tech_stack", "period", "bullets"]),
+        skills=[legacy_backend(s) for s in parsed.get("skills", [])],
+        technical_skills=[legacy_backend(s) for s in parsed.get("technical_skills", [])],
+        soft_skills=[legacy_backend(s) for s in parsed.get("soft_skills", [])],
+        certifications=parsed.get("certifications", []),
+    )
+
+
+def legacy_streamlit(raw_content):
+    return legacy_recursive(json.loads(raw_content), legacy_backend)
+
+
+def cleaner(raw_content):
+    return CleanEnhanceResponse.model_validate_json(raw_content)
+
+
+def allocations(fn, raw):
+    fn(raw)  # warm up caches
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = fn(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in after.compare_to(before, "lineno") if s.count_diff > 0)
+    del result
+    return peak, blocks
+
+
+def main():
+    for fancy in (False, True):
+        resume = make_resume(fancy)
+        resume["certifications"] = [{"name": "AWS SA", "issuing_authority": "Amazon", "issue_date": "2022"}]
+        raw = json.dumps(resume, ensure_ascii=False)
+        assert legacy_api(raw).model_dump() == cleaner(raw).model_dump()
+
+        print(f"\n{'typographic' if fancy else 'ascii'} resume ({len(raw)} bytes of JSON)")
+        print(f"  {'variant':<20}{'time us':>10}{'peak KiB':>10}{'kept blocks':>13}")
+        for name, fn in (("legacy API", legacy_api), ("legacy Streamlit", legacy_streamlit), ("cleaner", cleaner)):
+            best = min(timeit.repeat(lambda: fn(raw), number=1000, repeat=5)) / 1000
+            peak, blocks = allocations(fn, raw)
+            print(f"  {name:<20}{best * 1e6:>10.1f}{peak / 1024:>10.1f}{blocks:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+PDF render time: Table-per-row layout vs. SectionHeader / SplitRow flowables.
+
+    python benchmarks/bench_pdf_layout.py
+
+Renders resumes sized to roughly 1, 2 and 5 pages with both layouts. Visual
+parity is checked by recording where every paragraph line and rule ends up
+on each page (absolute coordinates, after all canvas transforms) and
+comparing the two layouts.
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from reportlab.lib import colors  # noqa: E402
+from reportlab.pdfgen.canvas import Canvas  # noqa: E402
+from reportlab.platypus import Paragraph, Table, TableStyle  # noqa: E402
+
+from pdf_generator import ResumePDFGenerator  # noqa: E402
+
+
+class TablePDFGenerator(ResumePDFGenerator):
+    """The layout before: a styled Table for every header and split row."""
+
+    def _create_section_header(self, title):
+        p = Paragraph(title.upper(), self.styles['SectionHeader'])
+        t = Table([[p]], colWidths=['100%'])
+        t.setStyle(TableStyle([
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
+            ('LINEBELOW', (0, 0), (-1, -1), 1, colors.black),
+        ]))
+        return t
+
+    def _create_split_row(self, left_text, right_text, left_style='ItemTitle', right_style='RightAlign'):
+        p_left = Paragraph(left_text, self.styles[left_style])
+        p_right = Paragraph(right_text, self.styles[right_style])
+        t = Table([[p_left, p_right]], colWidths=['75%', '25%'])
+        t.setStyle(TableStyle([
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ]))
+        return t
+
+
+def make_resume(roles: int) -> dict:
+    return {
+        "name": "Jordan Example",
+        "email": "jordan@example.com",
+        "phone": "555 0100",
+        "linkedin": "https://linkedin.com/in/jordan",
+        "github": "https://github.com/jordan",
+        "professional_summary": "Backend engineer building reliable, observable distributed systems. " * 3,
+        "education": [
+            {"institution": f"University {i}", "location": "Austin, TX", "degree": "BSc Computer Science",
+             "period": f"20{10 + i} - 20{14 + i}"}
+            for i in range(2)
+        ],
+        "experience": [
+            {"role": f"Senior Engineer {i}", "company": f"Company {i}", "location": "Remote",
+             "period": f"20{10 + i % 10} - 20{11 + i % 10}",
+             "description": [f"Cut p99 latency of service {j} by {10 + j}% by reworking its caching layer" for j in range(5)]}
+            for i in range(roles)
+        ],
+        "projects": [
+            {"title": f"Project {i}", "duration": "2021", "tech_stack": ["Python", "Go", "Kafka"],
+             "description": ["Open-source stream processing tool with 400 stars"]}
+            for i in range(max(1, roles // 2))
+        ],
+        "skills": {"technical": ["Python", "Go", "Kafka", "Kubernetes"], "soft": ["Mentoring"]},
+        "certifications": ["AWS Certified Solutions Architect"],
+    }
+
+
+SIZES = {"1 page": 2, "2 pages": 8, "5 pages": 26}
+
+
+def page_count(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type /Page[^s]", pdf))
+
+
+def record_layout(generator, data) -> list:
+    """(page, kind, x, y, payload) for every paragraph line and rule drawn."""
+    marks = []
+    page = [1]
+
+    def absolute(canv, x, y):
+        a, b, c, d, e, f = canv._currentMatrix
+        return round(a * x + c * y + e, 2), round(b * x + d * y + f, 2)
+
+    orig_para_draw = Paragraph.drawOn
+    orig_line = Canvas.line
+    orig_show = Canvas.showPage
+
+    def para_draw(self, canvas, x, y, _sW=0):
+        marks.append((page[0], "text", *absolute(canvas, x, y), self.getPlainText()))
+        return orig_para_draw(self, canvas, x, y, _sW)
+
+    def line(self, x1, y1, x2, y2):
+        marks.append((page[0], "rule", *absolute(self, x1, y1), absolute(self, x2, y2)))
+        return orig_line(self, x1, y1, x2, y2)
+
+    def show_page(self):
+        page[0] += 1
+        return orig_show(self)
+
+    Paragraph.drawOn, Canvas.line, Canvas.showPage = para_draw, line, show_page
+    try:
+        generator.generate_pdf(data)
+    finally:
+        Paragraph.drawOn, Canvas.line, Canvas.showPage = orig_para_draw, orig_line, orig_show
+    return marks
+
+
+def main():
+    tables, flowables = TablePDFGenerator(), ResumePDFGenerator()
+    print(f"{'resume':<10}{'pages':>6}{'tables ms':>11}{'flowables ms':>14}{'speedup':>9}  layout")
+    for label, roles in SIZES.items():
+        data = make_resume(roles)
+        pages = page_count(flowables.generate_pdf(data).getvalue())
+        same = record_layout(tables, data) == record_layout(flowables, data)
+        t_old = min(timeit.repeat(lambda: tables.generate_pdf(data), number=5, repeat=5)) / 5
+        t_new = min(timeit.repeat(lambda: flowables.generate_pdf(data), number=5, repeat=5)) / 5
+        print(f"{label:<10}{pages:>6}{t_old * 1e3:>11.2f}{t_new * 1e3:>14.2f}{t_old / t_new:>8.2f}x  "
+              f"{'identical' if same else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Portfolio HTML: current renderer vs. the original f-string renderer.
+
+    python benchmarks/bench_portfolio.py
+
+Reports best-of-25 time per page (the two renderers take turns, so load on
+the machine hits both alike) and the tracemalloc peak of one render, for
+small, typical and large portfolios. "cold" renders with an empty fragment
+cache (new data); "rerun" re-renders unchanged data, as a Streamlit rerun
+does, so every card is a cache hit. The speedups are baseline (the frozen
+f-string renderer in legacy_portfolio.py) over each, so below 1x is a
+regression. Output parity is checked on the text and tag structure,
+ignoring indentation, the entity form of escaped quotes and the CSS escape
+of the timeline bullet glyph.
+"""
+import html
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from legacy_portfolio import generate_portfolio_html as legacy_portfolio_html  # noqa: E402
+
+from src.services.fragment_cache import fragment_cache  # noqa: E402
+from src.services.portfolio import generate_portfolio_html  # noqa: E402
+
+
+def make_portfolio(roles: int) -> dict:
+    """The dict shape app.py's build_portfolio_data produces."""
+    return {
+        "hero_name": "Jordan Q. Example",
+        "hero_title": "Backend engineer",
+        "hero_summary": "Backend engineer building reliable, observable distributed systems.",
+        "about_me": "I like turning slow, flaky services into boring ones. O'Reilly author & speaker.",
+        "profile_image": "https://example.com/me.png",
+        "education": [{"degree": "BSc Computer Science", "institution": "State University", "period": "2014 - 2018",
+                       "details": "CGPA: 3.8"}, "Exchange semester, TU Munich"],
+        "experience": [
+            {"title": f"Senior Engineer {i}", "company": f"Company {i}", "period": "2020 - 2023",
+             "bullets": [f"Cut p99 latency of service {j} by {10 + j}% <cache> rework" for j in range(4)]}
+            for i in range(roles)
+        ],
+        "projects": [
+            {"name": f"Project {i}", "duration": "2021", "tech_stack": ["Python", "Go", "Kafka"],
+             "highlights": ["Open-source stream processing tool with 400 stars"],
+             "github_link": f"https://github.com/jordan/project-{i}" if i % 2 else ""}
+            for i in range(roles)
+        ],
+        "skills": [f"Skill {i}" for i in range(4 * roles)],
+        "certifications": [{"name": f"Cert {i}", "issuer": "AWS", "date": "2022", "url": "https://aws.example"}
+                           for i in range(roles)] + ["Plain text cert"],
+        "contact_email": "jordan@example.com",
+        "contact_linkedin": "https://linkedin.com/in/jordan",
+        "contact_github": "https://github.com/jordan",
+        "resume_link": "https://example.com/resume.pdf",
+    }
+
+
+SIZES = {"small": 1, "typical": 4, "large": 20}
+
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_SPACES = re.compile(r"\s+")
+
+
+def normalized(page: str) -> str:
+    page = html.unescape(page).replace("\\25B9", "\u25b9")
+    return _SPACES.sub(" ", _BETWEEN_TAGS.sub("><", page)).replace("'", '"').strip()
+
+
+def best_times(*fns, number: int = 500, repeat: int = 25) -> list:
+    """Best per-call time of each fn, running them in turns."""
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            best[i] = min(best[i], timeit.timeit(fn, number=number) / number)
+    return best
+
+
+def peak_memory(fn, data) -> int:
+    """Peak bytes allocated during one (warm) render, including the returned page."""
+    fn(data)
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print(f"{'portfolio':<10}{'KiB':>6}{'baseline us':>13}{'cold us':>9}{'rerun us':>10}{'cold x':>8}{'rerun x':>9}"
+          f"{'baseline peak KiB':>19}{'rerun peak KiB':>16}  output")
+    for label, roles in SIZES.items():
+        data = make_portfolio(roles)
+        old, new = legacy_portfolio_html(data), generate_portfolio_html(data)
+        same = normalized(old) == normalized(new)
+
+        def cold():
+            fragment_cache.clear()
+            return generate_portfolio_html(data)
+
+        t_old, t_cold, t_new = best_times(
+            lambda: legacy_portfolio_html(data), cold, lambda: generate_portfolio_html(data)
+        )
+        peak_old, peak_new = peak_memory(legacy_portfolio_html, data), peak_memory(generate_portfolio_html, data)
+        print(f"{label:<10}{len(new) / 1024:>6.0f}{t_old * 1e6:>13.1f}{t_cold * 1e6:>9.1f}{t_new * 1e6:>10.1f}"
+              f"{t_old / t_cold:>7.2f}x{t_old / t_new:>8.2f}x"
+              f"{peak_old / 1024:>19.0f}{peak_new / 1024:>16.0f}  {'same' if same else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
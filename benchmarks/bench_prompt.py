@@ -0,0 +1,255 @@
+"""
+Prompt size before/after compaction on sample resumes.
+
+    python benchmarks/bench_prompt.py
+
+"before" is the repr-based resume text app.py used to build plus the
+pretty-printed schema system prompt; "after" is PromptBuilder.profile_text
+plus schema_prompt(RESUME_SCHEMA). Token counts use tiktoken when installed,
+otherwise the heuristic in prompt_builder.estimate_tokens.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.services.prompt_builder import (  # noqa: E402
+    RESUME_SCHEMA,
+    PromptBuilder,
+    schema_prompt,
+)
+
+LEGACY_SYSTEM_PROMPT = (
+    "You are an expert resume writer having 20 years of experience in resume writing. "
+    "Given a Jake Ryan style resume and a job description, you must return ONLY valid JSON "
+    "in this exact format (no extra text):\n\n"
+    "{\n"
+    '  "contact": {\n'
+    '    "name": "string",\n'
+    '    "phone": "string",\n'
+    '    "email": "string",\n'
+    '    "linkedin": "string or null",\n'
+    '    "github": "string or null"\n'
+    "  },\n"
+    '  "summary": "string",\n'
+    '  "education": [\n'
+    "    {\n"
+    '      "institution": "string",\n'
+    '      "location": "string",\n'
+    '      "degree": "string",\n'
+    '      "period": "string"\n'
+    "    }\n"
+    "  ],\n"
+    '  "experience": [\n'
+    "    {\n"
+    '      "company": "string",\n'
+    '      "title": "string",\n'
+    '      "location": "string",\n'
+    '      "period": "string",\n'
+    '      "bullets": ["string", "string"]\n'
+    "    }\n"
+    "  ],\n"
+    '  "projects": [\n'
+    "    {\n"
+    '      "name": "string",\n'
+    '      "tech_stack": ["string", "string"],\n'
+    '      "period": "string",\n'
+    '      "bullets": ["string", "string"]\n'
+    "    }\n"
+    "  ],\n"
+    '  "skills": ["string", "string"],\n'
+    '  "technical_skills": ["string", "string"],\n'
+    '  "soft_skills": ["string", "string"],\n'
+    '  "certifications": [\n'
+    "    {\n"
+    '      "name": "string",\n'
+    '      "issuing_authority": "string",\n'
+    '      "issue_date": "string",\n'
+    '      "certificate_id": "string"\n'
+    "    }\n"
+    "  ]\n"
+    "}\n\n"
+    "Do not include any explanation, only the JSON."
+)
+
+
+def legacy_resume_text(p: dict) -> str:
+    """The f-string app.py built before PromptBuilder (Python reprs included)."""
+    skills = p["skills"]
+    return f"""
+{p['name']}
+{p['email']} | {p['phone']}
+LinkedIn: {p['linkedin']}
+GitHub: {p['github']}
+
+Summary
+{p['summary']}
+
+Education
+{p['education']}
+
+Experience
+{p['experience']}
+
+Project 
+{p['projects']}
+
+Technical Skill
+{skills['technical'] if skills['technical'] else "Not provided"}
+
+Soft skill
+{skills['soft'] if skills['soft'] else "Not provided"}
+
+Certifications
+{p['certifications']}
+""".strip()
+
+
+def experience(company, role, start, end, desc, still=False):
+    return {
+        "company": company,
+        "role": role,
+        "start_date": start,
+        "end_date": end,
+        "still_working": still,
+        "description": desc,
+    }
+
+
+def project(title, duration, desc, tech, link=""):
+    return {"title": title, "duration": duration, "description": desc, "tech_stack": tech, "github_link": link}
+
+
+SAMPLES = {
+    "junior": {
+        "name": "Asha Verma",
+        "email": "asha@example.com",
+        "phone": "+91 98765 43210",
+        "linkedin": "linkedin.com/in/asha",
+        "github": "",
+        "summary": "Backend Python developer   specializing in FastAPI, PostgreSQL and Docker.",
+        "education": "- B.Tech in Computer Science, XYZ University (2019–2023)\n- 8.2 CGPA",
+        "experience": [
+            experience("Acme", "Intern", "2022-06-01", "2022-12-01",
+                       "- Built REST APIs with FastAPI\n- Wrote unit tests with pytest"),
+            experience("", "", "2024-01-01", "Present", ""),  # untouched second row
+        ],
+        "projects": [
+            project("Task API", "Jan 2023 – Jun 2023",
+                    "- Built REST APIs with FastAPI\n- Deployed on Docker", "Python, FastAPI, Docker"),
+        ],
+        "skills": {"technical": ["Python", "FastAPI", "Docker", "python"], "soft": ["Communication"]},
+        "certifications": "AWS Certified Cloud Practitioner",
+    },
+    "mid": {
+        "name": "Daniel Okafor",
+        "email": "daniel@example.com",
+        "phone": "555-0100",
+        "linkedin": "linkedin.com/in/dokafor",
+        "github": "github.com/dokafor",
+        "summary": (
+            "Full-stack engineer with 6 years of experience shipping React and Django products, "
+            "leading small teams and owning CI/CD."
+        ),
+        "education": "- BSc Software Engineering, State University (2012–2016)",
+        "experience": [
+            experience("Shopify-like Co", "Senior Engineer", "2020-03-01", "", (
+                "- Led migration of checkout to React, cutting bundle size by 35%\n"
+                "- Mentored 4 engineers and ran weekly code reviews\n"
+                "- Owned CI/CD on GitHub Actions; reduced build time from 18 to 7 minutes\n"
+                "- Improved performance by 30% on the orders API"
+            ), still=True),
+            experience("Agency", "Software Engineer", "2016-07-01", "2020-02-28", (
+                "- Built Django REST APIs for 12 client projects\n"
+                "- Improved performance by 30% on the orders API\n"
+                "- Mentored 4 engineers and ran weekly code reviews"
+            )),
+        ],
+        "projects": [
+            project("Open Metrics", "2021", (
+                "- Prometheus exporter for Django apps\n- 400 GitHub stars\n"
+                "- Owned CI/CD on GitHub Actions; reduced build time from 18 to 7 minutes"
+            ), "Python, Django, Prometheus", "https://github.com/dokafor/open-metrics"),
+            project("Budget App", "2019", "- React Native budgeting app", "React Native, TypeScript"),
+        ],
+        "skills": {
+            "technical": ["Python", "Django", "React", "TypeScript", "PostgreSQL", "Docker", "AWS", "React"],
+            "soft": ["Mentoring", "Communication", "Ownership", "communication"],
+        },
+        "certifications": "- AWS Solutions Architect Associate\n- Certified Scrum Master",
+    },
+    "senior": {
+        "name": "Mei Lin",
+        "email": "mei@example.com",
+        "phone": "555-0199",
+        "linkedin": "linkedin.com/in/meilin",
+        "github": "github.com/meilin",
+        "summary": (
+            "Staff engineer focused on distributed systems, data platforms and developer productivity. "
+            "Built and scaled event pipelines processing billions of events per day."
+        ),
+        "education": (
+            "- MSc Computer Science, Tech Institute (2008–2010)\n"
+            "- BSc Mathematics, City University (2004–2008)"
+        ),
+        "experience": [
+            experience(f"Company {i}", role, f"{2010 + 3 * i}-01-01", f"{2013 + 3 * i}-01-01", "\n".join([
+                f"- Designed the {area} platform serving {10 * (i + 1)}M requests per day",
+                "- Partnered with product and data science on quarterly roadmaps",
+                f"- Cut p99 latency of the {area} service by {20 + i * 5}%",
+                "- Ran the on-call rotation and incident reviews for the team",
+            ]))
+            for i, (role, area) in enumerate([
+                ("Engineer", "billing"), ("Senior Engineer", "search"),
+                ("Tech Lead", "ingestion"), ("Staff Engineer", "analytics"),
+            ])
+        ],
+        "projects": [
+            project(f"Project {i}", f"20{14 + i}", "\n".join([
+                f"- Open-source tool number {i} for stream processing",
+                "- Partnered with product and data science on quarterly roadmaps",
+            ]), "Go, Kafka, Kubernetes, Go")
+            for i in range(4)
+        ],
+        "skills": {
+            "technical": ["Go", "Java", "Kafka", "Kubernetes", "Terraform", "Spark", "Flink", "AWS", "GCP",
+                          "kafka", "Kubernetes"],
+            "soft": ["Leadership", "Mentoring", "Stakeholder management", "Technical writing"],
+        },
+        "certifications": "- CKA\n- Google Professional Cloud Architect",
+    },
+}
+
+
+def main():
+    builder = PromptBuilder()
+    new_system = schema_prompt(RESUME_SCHEMA, role="an expert resume writer with 20 years of experience")
+
+    print(f"{'sample':<10}{'part':<10}{'before':>8}{'after':>8}{'saved':>8}")
+    total_before = total_after = 0
+    for name, profile in SAMPLES.items():
+        before_text = legacy_resume_text(profile)
+        after_text = builder.profile_text(profile)
+        for part, before, after in (
+            ("resume", before_text, after_text),
+            ("system", LEGACY_SYSTEM_PROMPT, new_system),
+        ):
+            r = builder.report(before, after)
+            total_before += r["tokens_before"]
+            total_after += r["tokens_after"]
+            print(f"{name:<10}{part:<10}{r['tokens_before']:>8}{r['tokens_after']:>8}{r['saved_pct']:>7}%")
+
+    print(f"{'total':<20}{total_before:>8}{total_after:>8}"
+          f"{round((1 - total_after / total_before) * 100, 1):>7}%")
+
+    n = 2000
+    t0 = time.perf_counter()
+    for _ in range(n):
+        builder.profile_text(SAMPLES["senior"])
+    print(f"profile_text: {(time.perf_counter() - t0) / n * 1e6:.0f} us per call (senior sample)")
+    print(f"tokenizer: {builder.stats()['tokenizer']}")
+
+
+if __name__ == "__main__":
+    main()
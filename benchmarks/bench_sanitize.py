@@ -0,0 +1,127 @@
+"""
+Shared sanitizer vs. the two per-module versions it replaced.
+
+    python benchmarks/bench_sanitize.py
+
+Runs every variant over the strings of sample resumes (mostly ASCII, as
+model output usually is, and a typography-heavy variant) and checks that
+the new sanitizer matches the old backend table exactly. "replacements-only
+table" is the same sanitizer without the identity entries in _TABLE.
+"""
+import os
+import sys
+import timeit
+import unicodedata
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.services.sanitize import REPLACEMENTS, sanitize_text_for_pdf  # noqa: E402
+
+BACKEND_REPLACEMENTS = {
+    "‐": "-", "‑": "-", "‒": "-", "–": "-", "—": "-", "―": "-",
+    "−": "-", "‘": "'", "’": "'", "“": '"', "”": '"', " ": " ",
+    "•": "*",
+}
+STREAMLIT_REPLACEMENTS = {
+    "–": "-", "—": "-", "“": '"', "”": '"', "‘": "'", "’": "'", "•": "*",
+}
+
+
+def legacy_backend(text):
+    """src/backend/main.py before the shared module."""
+    if not text:
+        return ""
+    for char, replacement in BACKEND_REPLACEMENTS.items():
+        text = text.replace(char, replacement)
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+def legacy_streamlit(text):
+    """ai_utils.py before the shared module."""
+    if not text:
+        return ""
+    for char, rep in STREAMLIT_REPLACEMENTS.items():
+        text = text.replace(char, rep)
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+_BARE_TABLE = str.maketrans(REPLACEMENTS)
+
+
+def bare_table(text):
+    """sanitize_text_for_pdf with a translate table of the replacements only."""
+    if not text:
+        return ""
+    if text.isascii():
+        return text
+    text = text.translate(_BARE_TABLE)
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+def legacy_recursive(data, fn):
+    if isinstance(data, str):
+        return fn(data)
+    if isinstance(data, list):
+        return [legacy_recursive(item, fn) for item in data]
+    if isinstance(data, dict):
+        return {k: legacy_recursive(v, fn) for k, v in data.items()}
+    return data
+
+
+def make_resume(fancy: bool) -> dict:
+    dash, lq, rq, bullet = ("–", "“", "”", "• ") if fancy else ("-", '"', '"', "")
+    return {
+        "contact": {"name": "José Müller" if fancy else "Jose Muller", "email": "jose@example.com",
+                    "phone": "555 0100" if fancy else "555 0100", "linkedin": None, "github": None},
+        "summary": f"Backend engineer {dash} 8 years building {lq}boring{rq} reliable systems. " * 3,
+        "education": [{"institution": "State University", "location": "Austin, TX",
+                       "degree": "BSc Computer Science", "period": f"2010 {dash} 2014"}],
+        "experience": [
+            {"company": f"Company {i}", "title": "Senior Engineer", "location": "Remote",
+             "period": f"20{14 + i} {dash} 20{15 + i}",
+             "bullets": [f"{bullet}Cut p99 latency by {10 + j}% on the {lq}orders{rq} API" for j in range(5)]}
+            for i in range(5)
+        ],
+        "projects": [
+            {"name": f"Tool {i}", "tech_stack": ["Python", "Go", "Kafka"], "period": "2021",
+             "bullets": [f"{bullet}Open-source tool {dash} {i * 100} stars" for _ in range(3)]}
+            for i in range(3)
+        ],
+        "skills": ["Python", "Go", "Kafka", "Kubernetes", "PostgreSQL"] * 2,
+        "technical_skills": ["Python", "Go", "Kafka", "Kubernetes"],
+        "soft_skills": ["Mentoring", "Communication"],
+    }
+
+
+def strings(data):
+    out = []
+    legacy_recursive(data, lambda s: out.append(s) or s)
+    return out
+
+
+def main():
+    for fancy in (False, True):
+        resume = make_resume(fancy)
+        texts = strings(resume)
+        assert legacy_recursive(resume, legacy_backend) == legacy_recursive(resume, sanitize_text_for_pdf)
+        assert [legacy_backend(t) for t in texts] == [bare_table(t) for t in texts]
+
+        label = "typographic" if fancy else "ascii"
+        n = 2000
+        print(f"\n{label} resume: {len(texts)} strings, {sum(map(len, texts))} chars (per resume)")
+        for name, fn in (
+            ("legacy backend (per string)", lambda: [legacy_backend(t) for t in texts]),
+            ("legacy streamlit (per string)", lambda: [legacy_streamlit(t) for t in texts]),
+            ("translate (per string)", lambda: [sanitize_text_for_pdf(t) for t in texts]),
+            ("replacements-only table", lambda: [bare_table(t) for t in texts]),
+            ("legacy clean_data_recursive", lambda: legacy_recursive(resume, legacy_streamlit)),
+            ("translate, recursive", lambda: legacy_recursive(resume, sanitize_text_for_pdf)),
+        ):
+            best = min(timeit.repeat(fn, number=n, repeat=5)) / n
+            print(f"  {name:<32}{best * 1e6:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
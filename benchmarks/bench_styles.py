@@ -0,0 +1,61 @@
+"""
+Per-render generator construction cost: fresh stylesheet vs. shared styles.
+
+    python benchmarks/bench_styles.py
+
+"before" builds the sample stylesheet + resume styles on every generator,
+as ResumePDFGenerator.__init__ used to; "after" is the cached registry.
+Also renders from 8 threads at once with one shared generator and checks
+every output matches a single-threaded render.
+"""
+import os
+import sys
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from reportlab import rl_config  # noqa: E402
+
+from bench_sanitize import make_resume  # noqa: E402
+from pdf_generator import ResumeDOCXGenerator, ResumePDFGenerator, get_resume_styles, resume_pdf_generator  # noqa: E402
+from src.services.pipeline import resume_data_from_enhanced  # noqa: E402
+
+# Deterministic PDFs (no timestamps / random IDs) so outputs can be compared
+rl_config.invariant = 1
+
+
+class LegacyPDFGenerator(ResumePDFGenerator):
+    def __init__(self):
+        self.styles = get_resume_styles.__wrapped__()
+
+
+def main():
+    data = resume_data_from_enhanced(make_resume(False))
+    n = 200
+
+    print("construction (per generator)")
+    for name, fn in (
+        ("fresh stylesheet (before)", LegacyPDFGenerator),
+        ("shared styles (after)", ResumePDFGenerator),
+        ("DOCX generator", ResumeDOCXGenerator),
+    ):
+        best = min(timeit.repeat(fn, number=n, repeat=5)) / n
+        print(f"  {name:<32}{best * 1e6:>9.1f} us")
+
+    print("\nfull PDF render (construct + generate_pdf)")
+    for name, fn in (
+        ("new generator, fresh styles", lambda: LegacyPDFGenerator().generate_pdf(data)),
+        ("shared generator", lambda: resume_pdf_generator.generate_pdf(data)),
+    ):
+        best = min(timeit.repeat(fn, number=20, repeat=3)) / 20
+        print(f"  {name:<32}{best * 1e3:>9.2f} ms")
+
+    expected = resume_pdf_generator.generate_pdf(data).getvalue()
+    with ThreadPoolExecutor(8) as pool:
+        outputs = list(pool.map(lambda _: resume_pdf_generator.generate_pdf(data).getvalue(), range(32)))
+    print(f"\n32 renders on 8 threads with one generator: {'identical' if all(o == expected for o in outputs) else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
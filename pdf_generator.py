@@ -1,118 +1,182 @@
 # src/backend/pdf_generator.py
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.colors import black, grey
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 import io
+import os
+from functools import lru_cache
+from types import MappingProxyType
 from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+
+@lru_cache(maxsize=None)
+def get_resume_styles():
+    """
+    Sample stylesheet plus the resume styles, built once per process.
+
+    Returned as a read-only mapping shared by every generator and thread;
+    ReportLab only reads styles while laying out paragraphs.
+    """
+    # 1. Setup Styles to match Jake Ryan's LaTeX look
+    styles = getSampleStyleSheet()
+
+    # Name: Large, Centered, Bold
+    styles.add(ParagraphStyle(
+        name='NameHeader',
+        fontName='Helvetica-Bold',
+        fontSize=20,
+        leading=24,
+        alignment=TA_CENTER,
+        spaceAfter=4
+    ))
+
+    # Contact Info: Small, Centered
+    styles.add(ParagraphStyle(
+        name='ContactInfo',
+        fontName='Helvetica',
+        fontSize=9,
+        alignment=TA_CENTER,
+        spaceAfter=10
+    ))
+
+    # Section Header: Uppercase, Bold, with a line underneath (drawn by SectionHeader)
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        fontName='Helvetica-Bold',
+        fontSize=11,
+        leading=14,
+        spaceBefore=6,
+        spaceAfter=2,
+        textTransform='uppercase' # Simulates the uppercase look
+    ))
+
+    # Content Main: Bold (e.g., University Name)
+    styles.add(ParagraphStyle(
+        name='ItemTitle',
+        fontName='Helvetica-Bold',
+        fontSize=10,
+        leading=12,
+        alignment=TA_LEFT
+    ))
+
+    # Content Sub: Italic/Normal (e.g., Role, Degree)
+    styles.add(ParagraphStyle(
+        name='ItemSub',
+        fontName='Helvetica-Oblique',
+        fontSize=10,
+        leading=12,
+        alignment=TA_LEFT
+    ))
+
+    # Right Aligned Date/Location
+    styles.add(ParagraphStyle(
+        name='RightAlign',
+        fontName='Helvetica',
+        fontSize=10,
+        leading=12,
+        alignment=TA_RIGHT
+    ))
+
+    # Bullet Points
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        fontName='Helvetica',
+        fontSize=9.5,
+        leading=12,
+        leftIndent=12,
+        firstLineIndent=0,
+        alignment=TA_LEFT,
+        spaceAfter=1
+    ))
+
+    return MappingProxyType(dict(styles.byName))
+
+
+def _as_target(sink):
+    """File objects are written to as-is; anything else is treated as a path."""
+    return sink if hasattr(sink, "write") else os.fspath(sink)
+
+
+class SectionHeader(Flowable):
+    """
+    Section title with a full-width rule underneath, drawn straight on the
+    canvas. Same geometry as the one-cell Table it replaces (6pt side
+    padding, 3pt above, 1pt between text and rule) without the Table layout.
+    """
+
+    def __init__(self, paragraph):
+        super().__init__()
+        self.paragraph = paragraph
+
+    def wrap(self, availWidth, availHeight):
+        _, h = self.paragraph.wrapOn(self.canv, availWidth - 12, availHeight - 4)
+        self.width, self.height = availWidth, h + 4
+        return self.width, self.height
+
+    def draw(self):
+        self.paragraph.drawOn(self.canv, 6, 1)
+        self.canv.saveState()
+        self.canv.setLineWidth(1)
+        self.canv.setStrokeColor(colors.black)
+        self.canv.setLineCap(1)
+        self.canv.setLineJoin(1)
+        self.canv.line(0, 0, self.width, 0)
+        self.canv.restoreState()
+
+
+class SplitRow(Flowable):
+    """
+    Two paragraphs side by side (e.g. title left, date right), bottom-aligned
+    like the unpadded two-column Table it replaces.
+    """
+
+    def __init__(self, left, right, left_fraction=0.75):
+        super().__init__()
+        self.left = left
+        self.right = right
+        self.left_fraction = left_fraction
+
+    def wrap(self, availWidth, availHeight):
+        self._left_width = availWidth * self.left_fraction
+        _, lh = self.left.wrapOn(self.canv, self._left_width, availHeight)
+        _, rh = self.right.wrapOn(self.canv, availWidth * (1 - self.left_fraction), availHeight)
+        self.width, self.height = availWidth, max(lh, rh)
+        return self.width, self.height
+
+    def draw(self):
+        self.left.drawOn(self.canv, 0, 0)
+        self.right.drawOn(self.canv, self._left_width, 0)
+
+
 class ResumePDFGenerator:
+    """Holds no per-render state: one instance can serve every rerun and thread."""
+
     def __init__(self):
-        # 1. Setup Styles to match Jake Ryan's LaTeX look
-        self.styles = getSampleStyleSheet()
-        
-        # Name: Large, Centered, Bold
-        self.styles.add(ParagraphStyle(
-            name='NameHeader',
-            fontName='Helvetica-Bold',
-            fontSize=20,
-            leading=24,
-            alignment=TA_CENTER,
-            spaceAfter=4
-        ))
-
-        # Contact Info: Small, Centered
-        self.styles.add(ParagraphStyle(
-            name='ContactInfo',
-            fontName='Helvetica',
-            fontSize=9,
-            alignment=TA_CENTER,
-            spaceAfter=10
-        ))
-
-        # Section Header: Uppercase, Bold, with a line underneath (handled by Table)
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            fontName='Helvetica-Bold',
-            fontSize=11,
-            leading=14,
-            spaceBefore=6,
-            spaceAfter=2,
-            textTransform='uppercase' # Simulates the uppercase look
-        ))
-
-        # Content Main: Bold (e.g., University Name)
-        self.styles.add(ParagraphStyle(
-            name='ItemTitle',
-            fontName='Helvetica-Bold',
-            fontSize=10,
-            leading=12,
-            alignment=TA_LEFT
-        ))
-
-        # Content Sub: Italic/Normal (e.g., Role, Degree)
-        self.styles.add(ParagraphStyle(
-            name='ItemSub',
-            fontName='Helvetica-Oblique',
-            fontSize=10,
-            leading=12,
-            alignment=TA_LEFT
-        ))
-
-        # Right Aligned Date/Location
-        self.styles.add(ParagraphStyle(
-            name='RightAlign',
-            fontName='Helvetica',
-            fontSize=10,
-            leading=12,
-            alignment=TA_RIGHT
-        ))
-
-        # Bullet Points
-        self.styles.add(ParagraphStyle(
-            name='BulletPoint',
-            fontName='Helvetica',
-            fontSize=9.5,
-            leading=12,
-            leftIndent=12,
-            firstLineIndent=0,
-            alignment=TA_LEFT,
-            spaceAfter=1
-        ))
+        self.styles = get_resume_styles()
 
     def _create_section_header(self, title):
         """Creates a section header with a horizontal line under it."""
-        # We use a table to create the bottom border effect
-        p = Paragraph(title.upper(), self.styles['SectionHeader'])
-        data = [[p]]
-        t = Table(data, colWidths=['100%'])
-        t.setStyle(TableStyle([
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 1),
-            ('LINEBELOW', (0, 0), (-1, -1), 1, colors.black),
-        ]))
-        return t
+        return SectionHeader(Paragraph(title.upper(), self.styles['SectionHeader']))
 
     def _create_split_row(self, left_text, right_text, left_style='ItemTitle', right_style='RightAlign'):
         """Creates a row with text on the left and text on the right."""
         p_left = Paragraph(left_text, self.styles[left_style])
         p_right = Paragraph(right_text, self.styles[right_style])
-        data = [[p_left, p_right]]
-        t = Table(data, colWidths=['75%', '25%'])
-        t.setStyle(TableStyle([
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-        ]))
-        return t
-
-    def generate_pdf(self, resume_data: dict):
-        buffer = io.BytesIO()
+        return SplitRow(p_left, p_right)
+
+    def generate_pdf(self, resume_data: dict, sink=None):
+        """
+        Renders the resume into `sink`: a file path or any object with
+        write() (open file, zip entry, chunked HTTP response). Returns the
+        sink. Without one, renders into a new BytesIO, rewound for reading.
+        """
+        buffer = io.BytesIO() if sink is None else _as_target(sink)
         # Narrow margins like the Jake Ryan template 
         doc = SimpleDocTemplate(
             buffer, 
@@ -283,11 +347,8 @@ class ResumePDFGenerator:
     
             
         doc.build(story)
-        buffer.seek(0)
-        return buffer
-
-        doc.build(story)
-        buffer.seek(0)
+        if sink is None:
+            buffer.seek(0)
         return buffer
 # --- Add this import at the top of pdf_generator.py ---
 from docx import Document
@@ -296,7 +357,8 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 # --- Add this class at the bottom of pdf_generator.py ---
 class ResumeDOCXGenerator:
-    def generate_docx(self, resume_data: dict):
+    def generate_docx(self, resume_data: dict, sink=None):
+        """Same contract as ResumePDFGenerator.generate_pdf: renders into `sink`, or a new BytesIO."""
         doc = Document()
         
         # 1. Name & Contact (Center Aligned)
@@ -425,8 +487,14 @@ class ResumeDOCXGenerator:
                     doc.add_paragraph(text, style="List Bullet")
 
 
-        # Save to buffer
-        buffer = io.BytesIO()
+        # Save to the sink (or a fresh buffer)
+        buffer = io.BytesIO() if sink is None else _as_target(sink)
         doc.save(buffer)
-        buffer.seek(0)
-        return buffer
\ No newline at end of file
+        if sink is None:
+            buffer.seek(0)
+        return buffer
+
+
+# Shared instances (styles are built on first use, then reused)
+resume_pdf_generator = ResumePDFGenerator()
+resume_docx_generator = ResumeDOCXGenerator()
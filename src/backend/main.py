@@ -1,55 +1,65 @@
 # src/backend/main.py
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header
+import asyncio
+from fastapi.responses import JSONResponse, StreamingResponse, Response
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 import os
-import httpx
 import json
+import base64
+import httpx
+from typing import Optional, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from src.services.portfolio import generate_portfolio_html
-from pdf_generator import ResumePDFGenerator
-import unicodedata
+from src.services.llm_client import llm_client, LLMStreamError
+from src.services.rate_limit import LLMOverloadedError
+from src.services.llm_cache import response_cache, make_cache_key
+from src.services.single_flight import llm_flights
+from src.services.model_router import ModelRouter
+from src.services.prompt_builder import prompt_builder, schema_prompt, RESUME_SCHEMA
+from src.services.stream_json import IncrementalJSONObject
+from src.services.schema_cleaner import cleaning_model
+from src.services.jobs import job_queue, QueueFullError, TERMINAL_STATES
+from src.services.render_cache import render_cache, render_key, key_kind
+from src.services.chunk_sink import stream_render
+from src.services.compress import output_optimizer, negotiate_encoding, ENCODINGS
+from src.services.fragment_cache import fragment_cache
+from src.services.pipeline import run_pipeline, resume_data_from_enhanced, portfolio_data_from_enhanced
+from pdf_generator import resume_pdf_generator, resume_docx_generator
 
 from .models.schemas import (
     ResumeCreate,
     GenAIEnhanceRequest,
     GenAIEnhanceResponse,
-    ContactInfo,
     EducationItem,
     ExperienceItem,
     ProjectItem,
     CertificationItem,
     CoverLetterResponse,
+    EnhanceStreamEvent,
     PortfolioResponse,
     PortfolioProject,
+    BundleResponse,
+    JobSubmitResponse,
+    JobStatus,
 )
-def sanitize_text_for_pdf(text: str) -> str:
-    if not text:
-        return ""
-    # Replace smart quotes and dashes with standard ASCII versions
-    replacements = {
-        "\u2010": "-",  # HYPHEN (The likely culprit!)
-        "\u2011": "-",  # NON-BREAKING HYPHEN
-        "\u2012": "-",  # FIGURE DASH
-        "\u2013": "-",  # EN DASH
-        "\u2014": "-",  # EM DASH
-        "\u2015": "-",  # HORIZONTAL BAR
-        "\u2212": "-",  # MINUS SIGN
-        "\u2018": "'",  # LEFT SINGLE QUOTATION MARK
-        "\u2019": "'",  # RIGHT SINGLE QUOTATION MARK
-        "\u201C": '"',  # LEFT DOUBLE QUOTATION MARK
-        "\u201D": '"',  # RIGHT DOUBLE QUOTATION MARK
-        "\u00A0": " ",  # NO-BREAK SPACE
-        "\u2022": "*",  # BULLET
-    }
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
-    return text
 # -------------------------------------------------
 # FastAPI app
 # -------------------------------------------------
 
-app = FastAPI(title="AI Resume Builder API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared OpenRouter connection pool and job workers live as long as the app
+    job_queue.start()
+    yield
+    await job_queue.stop()
+    await llm_client.aclose()
+
+
+app = FastAPI(title="AI Resume Builder API", lifespan=lifespan)
 
 # -------------------------------------------------
 # Basic info / health endpoints
@@ -79,6 +89,23 @@ def get_version():
     }
 
 
+@app.get("/metrics/llm")
+def llm_metrics():
+    return {
+        "client": llm_client.stats(),
+        "cache": response_cache.stats(),
+        "single_flight": llm_flights.stats(),
+        "limiter": llm_client.guard.stats(),
+        "models": model_router.stats(),
+        "prompts": prompt_builder.stats(),
+    }
+
+
+@app.get("/metrics/render")
+def render_metrics():
+    return {**render_cache.stats(), "output": output_optimizer.stats(), "fragments": fragment_cache.stats()}
+
+
 # -------------------------------------------------
 # Test endpoint for ResumeCreate model
 # -------------------------------------------------
@@ -105,68 +132,47 @@ if not OPENROUTER_API_KEY:
 
 OPENROUTER_MODEL = "nvidia/nemotron-3-nano-30b-a3b:free"
 
+# Comma-separated pool of interchangeable models; the router prefers the
+# fastest healthy one and hedges slow calls onto the next
+OPENROUTER_MODELS = [
+    m.strip() for m in os.getenv("OPENROUTER_MODELS", OPENROUTER_MODEL).split(",") if m.strip()
+]
+model_router = ModelRouter(OPENROUTER_MODELS)
+
+
+def upstream_error(status_code: int, detail: str, retry_after: str = None) -> HTTPException:
+    """
+    OpenRouter still rate limiting after our retries -> 429 with Retry-After,
+    so clients back off instead of treating it as a server bug. Anything else -> 500.
+    """
+    if status_code == 429:
+        return HTTPException(
+            status_code=429,
+            detail=f"OpenRouter rate limit: {detail}",
+            headers={"Retry-After": retry_after or "10"},
+        )
+    return HTTPException(
+        status_code=500,
+        detail=f"OpenRouter error: {status_code} {detail}",
+    )
+
+
+@app.exception_handler(LLMOverloadedError)
+async def llm_overloaded_handler(request, exc: LLMOverloadedError):
+    # Shed locally by the concurrency limiter before reaching OpenRouter
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
 
 # -------------------------------------------------
 # Helper: call OpenRouter to enhance resume
 # -------------------------------------------------
 
 
-async def call_openrouter_for_resume(
-    resume_text: str,
-    job_description: str,
-) -> GenAIEnhanceResponse:
-    system_prompt = (
-        "You are an expert resume writer having 20 years of experience in resume writing. "
-        "Given a Jake Ryan style resume and a job description, you must return ONLY valid JSON "
-        "in this exact format (no extra text):\n\n"
-        "{\n"
-        '  \"contact\": {\n'
-        '    \"name\": \"string\",\n'
-        '    \"phone\": \"string\",\n'
-        '    \"email\": \"string\",\n'
-        '    \"linkedin\": \"string or null\",\n'
-        '    \"github\": \"string or null\"\n'
-        "  },\n"
-        '  \"summary\": \"string\",\n'
-        '  \"education\": [\n'
-        "    {\n"
-        '      \"institution\": \"string\",\n'
-        '      \"location\": \"string\",\n'
-        '      \"degree\": \"string\",\n'
-        '      \"period\": \"string\"\n'
-        "    }\n"
-        "  ],\n"
-        '  \"experience\": [\n'
-        "    {\n"
-        '      \"company\": \"string\",\n'
-        '      \"title\": \"string\",\n'
-        '      \"location\": \"string\",\n'
-        '      \"period\": \"string\",\n'
-        '      \"bullets\": [\"string\", \"string\"]\n'
-        "    }\n"
-        "  ],\n"
-        '  \"projects\": [\n'
-        "    {\n"
-        '      \"name\": \"string\",\n'
-        '      \"tech_stack\": [\"string\", \"string\"],\n'
-        '      \"period\": \"string\",\n'
-        '      \"bullets\": [\"string\", \"string\"]\n'
-        "    }\n"
-        "  ],\n"
-        '  \"skills\": [\"string\", \"string\"],\n'
-        '  \"technical_skills\": [\"string\", \"string\"],\n'
-        '  \"soft_skills\": [\"string\", \"string\"],\n'
-        '  \"certifications\": [\n'
-        "    {\n"
-        '      \"name\": \"string\",\n'
-        '      \"issuing_authority\": \"string\",\n'
-        '      \"issue_date\": \"string\",\n'
-        '      \"certificate_id\": \"string\"\n'
-        "    }\n"
-        "  ]\n"
-        "}\n\n"
-        "Do not include any explanation, only the JSON."
-    )
+def build_resume_request(resume_text: str, job_description: str):
+    """Returns (payload, headers, cache_key) for a resume enhancement completion."""
+    # Schema as one compact JSON skeleton rather than a pretty-printed one
+    system_prompt = schema_prompt(RESUME_SCHEMA, role="an expert resume writer with 20 years of experience")
+    resume_text = prompt_builder.compact_text(resume_text)
 
     # Stronger instructions so model fills all fields
     user_prompt = (
@@ -182,88 +188,86 @@ async def call_openrouter_for_resume(
         "Return ONLY the JSON object in the exact schema described by the system message."
     )
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
     headers = {
         "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
         "HTTP-Referer": "http://localhost:8000",
         "X-Title": "AI Resume Builder",
     }
     payload = {
-        "model": OPENROUTER_MODEL,
+        "model": model_router.pick(),
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
     }
+    # Keyed on the pool, not the model: any model in it may answer
+    cache_key = make_cache_key(OPENROUTER_MODELS, system_prompt, resume_text, job_description)
+    return payload, headers, cache_key
+
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(url, headers=headers, json=payload)
+async def call_openrouter_for_resume(
+    resume_text: str,
+    job_description: str,
+) -> GenAIEnhanceResponse:
+    payload, headers, cache_key = build_resume_request(resume_text, job_description)
+
+    # Same input -> same enhancement (shared by /genai/enhance and /genai/portfolio)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return GenAIEnhanceResponse.model_validate(cached)
+
+    # Identical concurrent requests (double-click, two tabs) share one upstream call
+    return await llm_flights.do(
+        cache_key, lambda: _request_resume_enhancement(payload, headers, cache_key)
+    )
+
+
+async def _request_resume_enhancement(
+    payload: dict, headers: dict, cache_key: str
+) -> GenAIEnhanceResponse:
+    enhanced = await model_router.call(
+        lambda model: _request_resume_from_model({**payload, "model": model}, headers),
+        passthrough=(LLMOverloadedError,),
+    )
+    response_cache.set(cache_key, enhanced.model_dump())
+    return enhanced
+
+
+async def _request_resume_from_model(payload: dict, headers: dict) -> GenAIEnhanceResponse:
+    # Raises unless the answer parses, so a hedge never wins with garbage
+    response = await llm_client.post(payload, headers=headers)
 
     print("OpenRouter status:", response.status_code)
     print("OpenRouter response text:", response.text)
 
     if response.status_code != 200:
-        raise HTTPException(
-            status_code=500,
-            detail=f"OpenRouter error: {response.status_code} {response.text}",
-        )
+        raise upstream_error(response.status_code, response.text, response.headers.get("retry-after"))
 
     data = response.json()
     raw_content = data["choices"][0]["message"]["content"]
 
+    return parse_resume_content(raw_content)
+
+
+# GenAIEnhanceResponse that sanitizes every string while it validates.
+# Fields the model leaves out default to empty; certifications are kept as returned.
+CleanEnhanceResponse = cleaning_model(GenAIEnhanceResponse, skip=("certifications",), lenient=True)
+
+
+def parse_resume_content(raw_content: str) -> GenAIEnhanceResponse:
+    """Parses the model's JSON answer and sanitizes it for the PDF generator, in one pass."""
     try:
-        parsed = json.loads(raw_content)
-    except json.JSONDecodeError as e:
+        return CleanEnhanceResponse.model_validate_json(raw_content)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise HTTPException(
+                status_code=500,
+                detail=f"Model did not return valid JSON: {e}",
+            )
         raise HTTPException(
             status_code=500,
-            detail=f"Model did not return valid JSON: {e}",
+            detail=f"Model JSON does not match the resume schema: {e}",
         )
-    def clean_list(items, fields):
-        cleaned = []
-        for item in items:
-            new_item = item.copy()
-            for field in fields:
-                if field in new_item and isinstance(new_item[field], str):
-                    new_item[field] = sanitize_text_for_pdf(new_item[field])
-                elif field in new_item and isinstance(new_item[field], list):
-                    # Clean list of strings (e.g., bullets)
-                    new_item[field] = [sanitize_text_for_pdf(s) for s in new_item[field]]
-            cleaned.append(new_item)
-        return cleaned
-    contact = parsed.get("contact", {}) or {}
-
-    clean_contact = {k: sanitize_text_for_pdf(v) if isinstance(v, str) else v for k, v in contact.items()}
-    
-    clean_summary = sanitize_text_for_pdf(parsed.get("summary", ""))
-    
-    clean_education = clean_list(parsed.get("education", []), ["institution", "location", "degree", "period"])
-    clean_experience = clean_list(parsed.get("experience", []), ["company", "title", "location", "period", "bullets"])
-    clean_projects = clean_list(parsed.get("projects", []), ["name", "tech_stack", "period", "bullets"])
-    
-    # Clean simple lists (Skills)
-    clean_skills = [sanitize_text_for_pdf(s) for s in parsed.get("skills", [])]
-    clean_tech_skills = [sanitize_text_for_pdf(s) for s in parsed.get("technical_skills", [])]
-    clean_soft_skills = [sanitize_text_for_pdf(s) for s in parsed.get("soft_skills", [])]
-
-    return GenAIEnhanceResponse(
-        contact=ContactInfo(
-            name=clean_contact.get("name", ""),
-            email=clean_contact.get("email", ""),
-            phone=clean_contact.get("phone"),
-            location=clean_contact.get("location"),
-            linkedin=clean_contact.get("linkedin"),
-            github=clean_contact.get("github"),
-        ),
-        summary=clean_summary,
-        education=clean_education,   # Uses cleaned data
-        experience=clean_experience, # Uses cleaned data
-        projects=clean_projects,     # Uses cleaned data
-        skills=clean_skills,
-        technical_skills=clean_tech_skills,
-        soft_skills=clean_soft_skills,
-        certifications=parsed.get("certifications", []), # Certs usually don't have long text, but you can clean if needed
-    )
 
 
 # -------------------------------------------------
@@ -281,48 +285,169 @@ async def enhance_resume(payload: GenAIEnhanceRequest):
 
 
 # -------------------------------------------------
-# Cover letter: helper and endpoint
+# Streaming enhancement (progressive rendering)
 # -------------------------------------------------
 
 
-async def call_openrouter_for_cover_letter(
-    resume_text: str, job_description: str
-) -> str:
-    system_prompt = (
-        "You are an expert cover letter writer. "
-        "Given a resume and a job description, write a professional, concise, 3–5 paragraph cover letter. "
-        "Return ONLY the cover letter text, no JSON, no explanations."
+def _section_adapters():
+    """Cleaning validator per top-level field of GenAIEnhanceResponse; list-of-model fields validate per item."""
+    adapters = {}
+    for name, field in CleanEnhanceResponse.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) is list:
+            item_type = get_args(annotation)[0]
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                adapters[name] = ("item", TypeAdapter(item_type))
+                continue
+        adapters[name] = ("field", TypeAdapter(annotation))
+    return adapters
+
+
+SECTION_ADAPTERS = _section_adapters()
+
+
+def _section_event(key: str, index, value):
+    spec = SECTION_ADAPTERS.get(key)
+    if spec is None:
+        return None
+    kind, adapter = spec
+    # Item-validated fields are emitted per element, the rest once complete
+    if (kind == "item") != (index is not None):
+        return None
+    try:
+        section = adapter.validate_python(value)
+    except ValidationError as e:
+        return EnhanceStreamEvent(event="error", section=key, index=index, data=str(e))
+    return EnhanceStreamEvent(
+        event="section", section=key, index=index, data=adapter.dump_python(section, mode="json")
+    )
+
+
+async def stream_openrouter_for_resume(resume_text: str, job_description: str):
+    """
+    Async generator of EnhanceStreamEvent.
+
+    Each section is emitted as soon as the model has finished writing it;
+    the last event ("done") carries the full response, which is also cached.
+    """
+    payload, headers, cache_key = build_resume_request(resume_text, job_description)
+
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        for name, (kind, _) in SECTION_ADAPTERS.items():
+            if kind == "item":
+                for i, item in enumerate(cached[name]):
+                    yield EnhanceStreamEvent(event="section", section=name, index=i, data=item)
+            else:
+                yield EnhanceStreamEvent(event="section", section=name, data=cached[name])
+        yield EnhanceStreamEvent(event="done", data=cached)
+        return
+
+    parser = IncrementalJSONObject()
+    async for delta in llm_client.stream(payload, headers=headers):
+        for key, index, value in parser.feed(delta):
+            event = _section_event(key, index, value)
+            if event is not None:
+                yield event
+
+    raw = parser.text
+    enhanced = parse_resume_content(raw[raw.find("{"): raw.rfind("}") + 1])
+    response_cache.set(cache_key, enhanced.model_dump())
+    yield EnhanceStreamEvent(event="done", data=enhanced.model_dump(mode="json"))
+
+
+def _sse(data: dict, event: str = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+@app.post("/genai/enhance/stream")
+async def stream_enhance_resume(payload: GenAIEnhanceRequest):
+    """Server-sent events: `event: section` per finished section, then `event: done`."""
+    events = stream_openrouter_for_resume(
+        resume_text=payload.resume_text,
+        job_description=payload.job_description,
     )
+    try:
+        first = await events.__anext__()
+    except LLMStreamError as e:
+        raise upstream_error(e.status_code, e.detail)
+
+    async def body():
+        yield _sse(first.model_dump(), event=first.event)
+        try:
+            async for event in events:
+                yield _sse(event.model_dump(), event=event.event)
+        except (LLMStreamError, LLMOverloadedError) as e:
+            yield _sse({"event": "error", "data": f"OpenRouter error: {e}"}, event="error")
+        except HTTPException as e:
+            yield _sse({"event": "error", "data": e.detail}, event="error")
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
+# -------------------------------------------------
+# Cover letter: helper and endpoint
+# -------------------------------------------------
+
+
+COVER_LETTER_SYSTEM_PROMPT = (
+    "You are an expert cover letter writer. "
+    "Given a resume and a job description, write a professional, concise, 3–5 paragraph cover letter. "
+    "Return ONLY the cover letter text, no JSON, no explanations."
+)
+
+
+def build_cover_letter_request(resume_text: str, job_description: str):
+    """Returns (payload, headers) for a cover letter completion."""
     user_prompt = (
         f"RESUME:\n{resume_text}\n\n"
         f"JOB DESCRIPTION:\n{job_description}\n\n"
         "Write a tailored cover letter for this role."
     )
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
     headers = {
         "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
         "HTTP-Referer": "http://localhost:8000",
         "X-Title": "AI Resume Builder",
     }
     payload = {
-        "model": OPENROUTER_MODEL,
+        "model": model_router.pick(),
         "messages": [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": COVER_LETTER_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt},
         ],
     }
+    return payload, headers
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(url, headers=headers, json=payload)
+
+async def call_openrouter_for_cover_letter(
+    resume_text: str, job_description: str
+) -> str:
+    payload, headers = build_cover_letter_request(resume_text, job_description)
+
+    flight_key = make_cache_key(
+        "cover-letter", OPENROUTER_MODELS, COVER_LETTER_SYSTEM_PROMPT, resume_text, job_description
+    )
+    return await llm_flights.do(flight_key, lambda: _request_cover_letter(payload, headers))
+
+
+async def _request_cover_letter(payload: dict, headers: dict) -> str:
+    return await model_router.call(
+        lambda model: _request_cover_letter_from_model({**payload, "model": model}, headers),
+        passthrough=(LLMOverloadedError,),
+    )
+
+
+async def _request_cover_letter_from_model(payload: dict, headers: dict) -> str:
+    response = await llm_client.post(payload, headers=headers)
 
     if response.status_code != 200:
-        raise HTTPException(
-            status_code=500,
-            detail=f"OpenRouter error: {response.status_code} {response.text}",
-        )
+        raise upstream_error(response.status_code, response.text, response.headers.get("retry-after"))
 
     data = response.json()
     try:
@@ -332,6 +457,8 @@ async def call_openrouter_for_cover_letter(
             status_code=500,
             detail=f"Unexpected OpenRouter response format: {e}",
         )
+    if not text or not text.strip():
+        raise HTTPException(status_code=500, detail="OpenRouter returned an empty cover letter")
 
     return text.strip()
 
@@ -345,18 +472,99 @@ async def generate_cover_letter(payload: GenAIEnhanceRequest):
     return CoverLetterResponse(cover_letter=letter)
 
 
-# -------------------------------------------------
-# Portfolio endpoint (uses enhanced resume)
-# -------------------------------------------------
+# What an OpenRouter stream can fail with once it is open: an error chunk,
+# the connection dropping or timing out, or a chunk that is not JSON
+STREAM_ERRORS = (LLMStreamError, httpx.TransportError, json.JSONDecodeError)
 
 
-@app.post("/genai/portfolio", response_model=PortfolioResponse)
-async def generate_portfolio(payload: GenAIEnhanceRequest):
-    enhanced = await call_openrouter_for_resume(
+def _stream_error(e: Exception) -> tuple:
+    """(status_code, detail) for one of STREAM_ERRORS."""
+    if isinstance(e, LLMStreamError):
+        return e.status_code, e.detail
+    if isinstance(e, json.JSONDecodeError):
+        return 502, f"malformed stream chunk: {e}"
+    return 502, f"stream interrupted: {type(e).__name__}"
+
+
+async def stream_openrouter_cover_letter(resume_text: str, job_description: str):
+    """
+    Yields cover letter text deltas as OpenRouter produces them.
+
+    The first delta is awaited here so upstream failures still surface as an
+    HTTP error before any bytes are sent to the client.
+    """
+    payload, headers = build_cover_letter_request(resume_text, job_description)
+    deltas = llm_client.stream(payload, headers=headers)
+    try:
+        first = await deltas.__anext__()
+    except StopAsyncIteration:
+        first = ""
+    except STREAM_ERRORS as e:
+        raise upstream_error(*_stream_error(e))
+
+    async def rest():
+        if first:
+            yield first
+        async for delta in deltas:
+            yield delta
+
+    return rest()
+
+
+# Last line of a format=text cover letter stream that was cut off upstream
+TEXT_STREAM_ERROR_MARKER = "[cover letter stream error]"
+
+
+@app.post("/genai/cover-letter/stream")
+async def stream_cover_letter(payload: GenAIEnhanceRequest, format: str = "sse"):
+    """
+    Streams the cover letter as it is generated.
+
+    format=sse (default): `data: {"delta": "..."}` events, then `event: done`,
+    or `event: error` if the upstream stream fails part way.
+    format=text: chunked text/plain for clients without an SSE parser. The
+    status is already 200 when a mid-stream failure happens, so the body then
+    ends with a line starting with TEXT_STREAM_ERROR_MARKER instead.
+    """
+    deltas = await stream_openrouter_cover_letter(
         resume_text=payload.resume_text,
         job_description=payload.job_description,
     )
 
+    if format == "text":
+        async def text():
+            try:
+                async for delta in deltas:
+                    yield delta
+            except STREAM_ERRORS as e:
+                status_code, detail = _stream_error(e)
+                yield f"\n\n{TEXT_STREAM_ERROR_MARKER} {status_code} {detail}\n"
+
+        return StreamingResponse(text(), media_type="text/plain; charset=utf-8")
+
+    async def events():
+        try:
+            async for delta in deltas:
+                yield _sse({"delta": delta})
+        except STREAM_ERRORS as e:
+            status_code, detail = _stream_error(e)
+            yield _sse({"status_code": status_code, "detail": detail}, event="error")
+            return
+        yield _sse({}, event="done")
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# -------------------------------------------------
+# Portfolio endpoint (uses enhanced resume)
+# -------------------------------------------------
+
+
+def build_portfolio_response(enhanced: GenAIEnhanceResponse) -> PortfolioResponse:
     return PortfolioResponse(
         hero_name=enhanced.contact.name,
         hero_title="Backend Python Developer",  # later you can infer this via AI
@@ -376,4 +584,318 @@ async def generate_portfolio(payload: GenAIEnhanceRequest):
         contact_email=enhanced.contact.email,
         contact_linkedin=enhanced.contact.linkedin,
         contact_github=enhanced.contact.github,
-    )
\ No newline at end of file
+    )
+
+
+@app.post("/genai/portfolio", response_model=PortfolioResponse)
+async def generate_portfolio(payload: GenAIEnhanceRequest):
+    enhanced = await call_openrouter_for_resume(
+        resume_text=payload.resume_text,
+        job_description=payload.job_description,
+    )
+
+    return build_portfolio_response(enhanced)
+
+
+# -------------------------------------------------
+# Bundle endpoint (resume + cover letter + portfolio + documents)
+# -------------------------------------------------
+
+
+def _render_pdf(enhanced: GenAIEnhanceResponse) -> str:
+    return base64.b64encode(render_document("pdf", enhanced)).decode("ascii")
+
+
+def _render_docx(enhanced: GenAIEnhanceResponse) -> str:
+    return base64.b64encode(render_document("docx", enhanced)).decode("ascii")
+
+
+def _render_portfolio_html(enhanced: GenAIEnhanceResponse) -> str:
+    return generate_portfolio_html(portfolio_data_from_enhanced(enhanced.model_dump()))
+
+
+@app.post("/genai/bundle", response_model=BundleResponse)
+async def generate_bundle(payload: GenAIEnhanceRequest):
+    """
+    Enhancement and cover letter run concurrently; portfolio and PDF/DOCX
+    rendering start as soon as the enhancement lands. Per-stage timings are
+    returned in `timings`.
+    """
+    results, timings = await run_pipeline(
+        enhance=lambda: call_openrouter_for_resume(payload.resume_text, payload.job_description),
+        cover_letter=lambda: call_openrouter_for_cover_letter(payload.resume_text, payload.job_description),
+        derived={
+            "portfolio": build_portfolio_response,
+            "portfolio_html": _render_portfolio_html,
+            "pdf": _render_pdf,
+            "docx": _render_docx,
+        },
+    )
+
+    return BundleResponse(
+        enhanced=results["enhanced"],
+        cover_letter=results["cover_letter"],
+        portfolio=results["portfolio"],
+        portfolio_html=results["portfolio_html"],
+        pdf_base64=results["pdf"],
+        docx_base64=results["docx"],
+        timings=timings,
+    )
+
+
+# -------------------------------------------------
+# Document rendering
+# -------------------------------------------------
+
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "4"))
+# For GET /render/{kind}/{key}: the URL is an unguessable content hash that never
+# changes meaning, so browsers and CDNs may keep it. Set "private, ..." to keep CDNs out.
+RENDER_IMMUTABLE_CACHE_CONTROL = os.getenv("RENDER_IMMUTABLE_CACHE_CONTROL", "public, max-age=31536000, immutable")
+
+# ReportLab / python-docx / HTML rendering is blocking; keep it off the event loop
+# and out of the default executor the LLM bridge and to_thread calls share.
+render_executor = ThreadPoolExecutor(RENDER_WORKERS, thread_name_prefix="render")
+
+DOCUMENTS = {
+    "pdf": {
+        "media_type": "application/pdf",
+        "filename": "resume.pdf",
+        "data": resume_data_from_enhanced,
+        "render": lambda d: resume_pdf_generator.generate_pdf(d).getvalue(),
+    },
+    "docx": {
+        "media_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "filename": "resume.docx",
+        "data": resume_data_from_enhanced,
+        "render": lambda d: resume_docx_generator.generate_docx(d).getvalue(),
+    },
+    "portfolio": {
+        "media_type": "text/html; charset=utf-8",
+        "filename": "portfolio.html",
+        "data": portfolio_data_from_enhanced,
+        "render": lambda d: output_optimizer.minify(generate_portfolio_html(d)),
+        # Text compresses well: precompressed variants are cached next to the minified bytes
+        "encodings": ENCODINGS,
+    },
+}
+
+
+def render_document(kind: str, enhanced: GenAIEnhanceResponse) -> bytes:
+    """Rendered bytes for an enhancement, from the render cache when possible (blocking)."""
+    document = DOCUMENTS[kind]
+    return render_cache.get_or_render(kind, document["data"](enhanced.model_dump()), document["render"])
+
+
+def _encoded(key: str, content: bytes, encoding: str) -> bytes:
+    """`content` in `encoding`, compressed once per document and cached under key.encoding (blocking)."""
+    if encoding == "identity":
+        return content
+    variant_key = f"{key}.{encoding}"
+    encoded = render_cache.get(variant_key)
+    if encoded is None:
+        encoded = output_optimizer.encode(content, encoding)
+        render_cache.set(variant_key, encoded)
+    return encoded
+
+
+def _render_encoded(kind: str, key: str, data, encoding: str) -> bytes:
+    content = render_cache.get_or_render(kind, data, DOCUMENTS[kind]["render"])
+    return _encoded(key, content, encoding)
+
+
+def _representation_headers(kind: str, key: str, encoding: str) -> dict:
+    """ETag per encoded representation; Vary whenever the kind has more than one."""
+    if not DOCUMENTS[kind].get("encodings"):
+        return {"ETag": f'"{key}"'}
+    headers = {"ETag": f'"{key}"' if encoding == "identity" else f'"{key}.{encoding}"', "Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return headers
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+
+
+async def _document_response(
+    kind: str, enhanced: GenAIEnhanceResponse, if_none_match: Optional[str], accept_encoding: Optional[str] = None
+) -> Response:
+    """
+    The ETag is the render cache key (content hash of the generator input),
+    so a matching If-None-Match is answered with 304 before anything is
+    rendered. Content-Location points at the immutable GET URL for the bytes.
+    Kinds with `encodings` are served precompressed per Accept-Encoding.
+    """
+    document = DOCUMENTS[kind]
+    data = document["data"](enhanced.model_dump())
+    key = render_key(kind, data)
+    encoding = negotiate_encoding(accept_encoding, document.get("encodings", ()))
+    headers = {
+        **_representation_headers(kind, key, encoding),
+        "Cache-Control": "no-cache",
+        "Content-Location": f"/render/{kind}/{key}",
+    }
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    loop = asyncio.get_running_loop()
+    try:
+        content = await loop.run_in_executor(render_executor, _render_encoded, kind, key, data, encoding)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{kind} rendering failed: {e}")
+    headers["Content-Disposition"] = f'attachment; filename="{document["filename"]}"'
+    return Response(content, media_type=document["media_type"], headers=headers)
+
+
+@app.post("/render/pdf")
+async def render_pdf(enhanced: GenAIEnhanceResponse, if_none_match: Optional[str] = Header(None)):
+    return await _document_response("pdf", enhanced, if_none_match)
+
+
+@app.post("/render/docx")
+async def render_docx(enhanced: GenAIEnhanceResponse, if_none_match: Optional[str] = Header(None)):
+    return await _document_response("docx", enhanced, if_none_match)
+
+
+@app.post("/render/portfolio")
+async def render_portfolio(
+    enhanced: GenAIEnhanceResponse,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    return await _document_response("portfolio", enhanced, if_none_match, accept_encoding)
+
+
+@app.get("/render/{kind}/{key}")
+async def get_rendered_document(
+    kind: str, key: str, if_none_match: Optional[str] = Header(None), accept_encoding: Optional[str] = Header(None)
+):
+    """Previously rendered bytes by content hash (see Content-Location), while they are still cached."""
+    if kind not in DOCUMENTS:
+        raise HTTPException(status_code=404, detail=f"Unknown document kind: {kind}")
+    # Only plain keys of this kind: not another kind's bytes, nor a cached encoded variant
+    if key_kind(key) != kind:
+        raise HTTPException(status_code=404, detail=f"Not a {kind} document key")
+    document = DOCUMENTS[kind]
+    encoding = negotiate_encoding(accept_encoding, document.get("encodings", ()))
+    headers = {**_representation_headers(kind, key, encoding), "Cache-Control": RENDER_IMMUTABLE_CACHE_CONTROL}
+    if _etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    content = render_cache.get(key)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Document is no longer cached; POST to /render/" + kind)
+    content = await asyncio.get_running_loop().run_in_executor(render_executor, _encoded, key, content, encoding)
+    headers["Content-Disposition"] = f'attachment; filename="{document["filename"]}"'
+    return Response(content, media_type=document["media_type"], headers=headers)
+
+
+@app.post("/render/pdf/stream")
+async def stream_resume_pdf(enhanced: GenAIEnhanceResponse):
+    """
+    Renders the PDF into a chunked sink on render_executor instead of a
+    BytesIO that is then copied. ReportLab writes the whole document at
+    canvas.save(), so the body starts once rendering is complete: this saves
+    the copy, not time to first byte.
+    """
+    data = resume_data_from_enhanced(enhanced.model_dump())
+    chunks = stream_render(lambda sink: resume_pdf_generator.generate_pdf(data, sink), render_executor)
+    try:
+        # Rendering fails before the first byte is written, so errors still get a status code
+        first = await anext(chunks)
+    except StopAsyncIteration:
+        first = b""
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"PDF rendering failed: {e}")
+
+    async def body():
+        yield first
+        async for chunk in chunks:
+            yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type="application/pdf",
+        headers={"Content-Disposition": 'attachment; filename="resume.pdf"'},
+    )
+
+
+# -------------------------------------------------
+# Background jobs (submit now, poll or subscribe for the result)
+# -------------------------------------------------
+
+
+async def _enhance_job(payload: GenAIEnhanceRequest):
+    return (await enhance_resume(payload)).model_dump(mode="json")
+
+
+async def _portfolio_job(payload: GenAIEnhanceRequest):
+    return (await generate_portfolio(payload)).model_dump(mode="json")
+
+
+async def _cover_letter_job(payload: GenAIEnhanceRequest):
+    return (await generate_cover_letter(payload)).model_dump(mode="json")
+
+
+async def _bundle_job(payload: GenAIEnhanceRequest):
+    return (await generate_bundle(payload)).model_dump(mode="json")
+
+
+job_queue.register("enhance", _enhance_job)
+job_queue.register("portfolio", _portfolio_job)
+job_queue.register("cover-letter", _cover_letter_job)
+job_queue.register("bundle", _bundle_job)
+
+
+@app.post("/jobs/{kind}", response_model=JobSubmitResponse, status_code=202)
+async def submit_job(kind: str, payload: GenAIEnhanceRequest):
+    """Queues a generation job (enhance, portfolio, cover-letter, bundle) and returns its id at once."""
+    try:
+        job_id = job_queue.submit(kind, payload)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown job kind: {kind}")
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    return JobSubmitResponse(job_id=job_id, status="queued")
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobStatus(**job)
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, poll_interval: float = 0.5):
+    """Server-sent events: one `event: status` per state change, ending with the finished job."""
+    if job_queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        last_status = None
+        while True:
+            job = job_queue.get(job_id)
+            if job is None:
+                yield _sse({"detail": "Job expired"}, event="error")
+                return
+            if job["status"] != last_status:
+                last_status = job["status"]
+                yield _sse(JobStatus(**job).model_dump(), event="status")
+            if last_status in TERMINAL_STATES:
+                return
+            await asyncio.sleep(poll_interval)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/metrics/jobs")
+def jobs_metrics():
+    return job_queue.stats()
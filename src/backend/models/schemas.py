@@ -1,7 +1,7 @@
 # src/backend/models/schemas.py
 
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 
 # -------------------------
 # User
@@ -142,6 +142,16 @@ class GenAIEnhanceResponse(BaseModel):
     certifications: List[CertificationItem]
 
 
+class EnhanceStreamEvent(BaseModel):
+    # "section": one finished piece of the resume (index set for list items)
+    # "error":   a section failed validation, or the stream broke
+    # "done":    the complete, validated GenAIEnhanceResponse
+    event: str
+    section: Optional[str] = None
+    index: Optional[int] = None
+    data: Any = None
+
+
 # -------------------------
 # Cover letter
 # -------------------------
@@ -175,6 +185,27 @@ class PortfolioResponse(BaseModel):
     contact_linkedin: Optional[str]
     contact_github: Optional[str]
 
+
+# -------------------------
+# Bundle (everything in one call)
+# -------------------------
+
+
+class StageTiming(BaseModel):
+    start_ms: float
+    end_ms: float
+    duration_ms: float
+
+
+class BundleResponse(BaseModel):
+    enhanced: GenAIEnhanceResponse
+    cover_letter: str
+    portfolio: PortfolioResponse
+    portfolio_html: str
+    pdf_base64: str
+    docx_base64: str
+    timings: Dict[str, StageTiming]
+
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 
@@ -233,3 +264,24 @@ class ResumeData(BaseModel):
 
     skills: Dict[str, List[str]]   # {"technical": [...], "soft": [...]}
     certifications: List[str]
+
+
+# -------------------------
+# Background jobs
+# -------------------------
+
+
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    kind: str
+    status: str  # queued | running | succeeded | failed
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
@@ -0,0 +1,230 @@
+"""
+Batch rendering of many resumes across processes.
+
+    python -m src.services.batch_render resumes.jsonl --out out/ [--kind pdf|docx] [--workers N]
+    python -m src.services.batch_render resumes.jsonl --out resumes.zip
+
+Each JSONL line is one resume dict (the shape ResumePDFGenerator takes).
+Documents are written as they finish, so memory stays flat however long the
+input is. Malformed lines and failed documents are reported with their line
+number and skipped, not fatal.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Batch settings (override through environment variables)
+BATCH_RENDER_WORKERS = int(os.getenv("BATCH_RENDER_WORKERS", str(os.cpu_count() or 1)))
+BATCH_RENDER_WINDOW = int(os.getenv("BATCH_RENDER_WINDOW", "4"))  # in-flight docs per worker
+
+EXTENSIONS = {"pdf": ".pdf", "docx": ".docx"}
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Set in each worker process by _init_worker
+_generator = None
+
+
+def _init_worker(kind: str):
+    """Imports the generators, builds the shared styles and renders one throwaway document."""
+    global _generator
+    import pdf_generator
+
+    pdf_generator.get_resume_styles()
+    _generator = pdf_generator.resume_pdf_generator if kind == "pdf" else pdf_generator.resume_docx_generator
+    _render(kind, {"name": "Warm Up", "professional_summary": "Loads fonts and caches."})
+
+
+def _render(kind: str, data: dict, path: str = None):
+    """The document's bytes, or with `path` its size after rendering it straight to that file."""
+    generate = _generator.generate_pdf if kind == "pdf" else _generator.generate_docx
+    if path is None:
+        return generate(data).getvalue()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        generate(data, tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return os.path.getsize(path)
+
+
+def _render_item(kind: str, index: int, data: dict, path: str = None):
+    try:
+        return index, _render(kind, data, path), None
+    except Exception as e:
+        return index, None, f"{type(e).__name__}: {e}"
+
+
+def output_name(index: int, data: dict, kind: str) -> str:
+    """0007-jane-doe.pdf: input line number first, so names stay unique and sorted."""
+    slug = _SLUG_RE.sub("-", str(data.get("name") or "resume").lower()).strip("-") or "resume"
+    return f"{index:04d}-{slug}{EXTENSIONS[kind]}"
+
+
+# -------------------------------------------------
+# Sinks
+# -------------------------------------------------
+
+
+class DirectorySink:
+    """One file per document under `path`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def target(self, name: str) -> str:
+        """Workers render straight into the file, so the bytes never travel back to this process."""
+        return os.path.join(self.path, name)
+
+    def write(self, name: str, data: bytes):
+        with open(self.target(name), "wb") as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+
+class ZipSink:
+    """All documents in one zip. PDF and DOCX are already compressed, so entries are stored."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED)
+
+    def target(self, name: str):
+        """None: only this process can append to the zip, so workers send the bytes back."""
+        return None
+
+    def write(self, name: str, data: bytes):
+        self._zip.writestr(name, data)
+
+    def close(self):
+        self._zip.close()
+
+
+def make_sink(out: str):
+    return ZipSink(out) if out.lower().endswith(".zip") else DirectorySink(out)
+
+
+# -------------------------------------------------
+# Engine
+# -------------------------------------------------
+
+
+def iter_jsonl(path: str, on_error=None):
+    """
+    (line number, resume dict) pairs from a JSONL file ("-" for stdin).
+    Blank lines are skipped; malformed ones go to on_error(line, error).
+    """
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError as e:
+                if on_error is not None:
+                    on_error(line_no, f"{type(e).__name__}: {e}")
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def render_batch(resumes, kind: str = "pdf", workers: int = BATCH_RENDER_WORKERS, target=None):
+    """
+    Renders an iterable of (index, resume dict) pairs in a process pool and
+    yields (index, data, bytes, error) as documents finish (not in input order).
+    At most `workers * BATCH_RENDER_WINDOW` documents are in flight, so a
+    long or lazy iterable is never read ahead in full. When target(index, data)
+    returns a path, the worker writes the document there and its size is
+    yielded in place of the bytes.
+    """
+    if kind not in EXTENSIONS:
+        raise ValueError(f"Unknown kind {kind!r} (expected one of {', '.join(EXTENSIONS)})")
+    window = max(1, workers * BATCH_RENDER_WINDOW)
+    resumes = iter(resumes)
+    pending = {}
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(kind,)) as pool:
+        while True:
+            for index, data in resumes:
+                path = target(index, data) if target is not None else None
+                pending[pool.submit(_render_item, kind, index, data, path)] = data
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                data = pending.pop(future)
+                index, content, error = future.result()
+                yield index, data, content, error
+
+
+def render_to_sink(resumes, sink, kind: str = "pdf", workers: int = BATCH_RENDER_WORKERS, on_error=None) -> dict:
+    """Renders (index, resume dict) pairs into `sink` and returns throughput stats."""
+    started = time.perf_counter()
+    docs = failed = total_bytes = 0
+    def target(index, data):
+        return sink.target(output_name(index, data, kind))
+
+    try:
+        for index, data, content, error in render_batch(resumes, kind, workers, target):
+            if error is not None:
+                failed += 1
+                if on_error is not None:
+                    on_error(index, error)
+                continue
+            if isinstance(content, int):  # already written by the worker
+                total_bytes += content
+            else:
+                sink.write(output_name(index, data, kind), content)
+                total_bytes += len(content)
+            docs += 1
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - started
+    return {
+        "kind": kind,
+        "workers": workers,
+        "docs": docs,
+        "failed": failed,
+        "bytes": total_bytes,
+        "seconds": round(elapsed, 3),
+        "docs_per_sec": round(docs / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render many resumes to PDF/DOCX in parallel.")
+    parser.add_argument("input", help="JSONL file of resume dicts, or - for stdin")
+    parser.add_argument("--out", required=True, help="output directory, or a .zip path")
+    parser.add_argument("--kind", choices=sorted(EXTENSIONS), default="pdf")
+    parser.add_argument("--workers", type=int, default=BATCH_RENDER_WORKERS)
+    args = parser.parse_args(argv)
+
+    failed = []
+
+    def report_error(line, error):
+        failed.append(line)
+        print(f"line {line}: {error}", file=sys.stderr)
+
+    records = iter_jsonl(args.input, on_error=report_error)
+    stats = render_to_sink(records, make_sink(args.out), args.kind, args.workers, report_error)
+    print(
+        f"{stats['docs']} {args.kind} rendered ({len(failed)} failed) in {stats['seconds']}s "
+        f"with {stats['workers']} workers: {stats['docs_per_sec']} docs/sec, {stats['bytes']} bytes -> {args.out}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
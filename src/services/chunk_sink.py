@@ -0,0 +1,80 @@
+import asyncio
+import io
+import os
+
+# Largest piece handed to the HTTP response at a time
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", str(64 * 1024)))
+# Chunks buffered ahead of a slow client before the writer thread blocks
+STREAM_QUEUE_CHUNKS = int(os.getenv("STREAM_QUEUE_CHUNKS", "8"))
+
+
+class ChunkSink(io.RawIOBase):
+    """
+    Write-only file object that forwards every write to an asyncio queue, so
+    a generator running in a worker thread can feed a response the event
+    loop is streaming out. Immutable bytes are sliced, not copied. With a
+    bounded queue a write blocks until the client has taken enough chunks.
+    """
+
+    def __init__(self, loop, queue: asyncio.Queue, chunk_size: int = STREAM_CHUNK_SIZE):
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+        self._chunk_size = chunk_size
+        self.bytes_written = 0
+        self.abandoned = False  # set when the reader stops early
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        if not isinstance(b, bytes):
+            b = bytes(b)  # the caller may reuse a bytearray / memoryview
+        view = memoryview(b)
+        for start in range(0, len(view), self._chunk_size):
+            if self.abandoned:
+                raise BrokenPipeError("stream reader went away")
+            self.put(view[start:start + self._chunk_size])
+        self.bytes_written += len(b)
+        return len(b)
+
+    def put(self, item):
+        """Blocks the calling (non-loop) thread until the queue has room for `item`."""
+        asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop).result()
+
+
+_DONE = object()
+
+
+async def stream_render(render, executor=None, chunk_size: int = STREAM_CHUNK_SIZE,
+                        max_chunks: int = STREAM_QUEUE_CHUNKS):
+    """
+    Runs render(sink) on `executor` and yields what it writes as it
+    arrives. An exception from render is raised from the generator after
+    the chunks written before it. If the generator is closed early, the
+    render's next write raises and its thread is released.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(max_chunks)
+    sink = ChunkSink(loop, queue, chunk_size)
+
+    def run():
+        try:
+            render(sink)
+        finally:
+            sink.put(_DONE)
+
+    task = loop.run_in_executor(executor, run)
+    try:
+        while (chunk := await queue.get()) is not _DONE:
+            yield chunk
+    except BaseException:
+        sink.abandoned = True
+        # Drain so a writer blocked on the full queue wakes up and sees `abandoned`
+        while not task.done():
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({task, getter}, return_when=asyncio.FIRST_COMPLETED)
+            getter.cancel()
+        task.exception()  # the BrokenPipeError it ended with is expected
+        raise
+    await task
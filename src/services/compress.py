@@ -0,0 +1,189 @@
+import gzip
+import os
+import re
+import threading
+
+try:
+    import brotli
+except ImportError:  # optional: gzip-only when brotli is not installed
+    brotli = None
+
+# Output settings (override through environment variables)
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "9"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "11"))
+
+# Best first: the order negotiate_encoding prefers when the client accepts several
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_STRING_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON_RE = re.compile(r":\s+")
+
+_HTML_TOKEN_RE = re.compile(r"(<!--.*?-->|<[^>]+>)", re.S)
+_HTML_SPACE_RE = re.compile(r"\s+")
+_TAG_NAME_RE = re.compile(r"</?([a-zA-Z0-9]+)")
+
+# Raw-text elements: kept as written (style content is CSS-minified instead)
+_RAW_TAGS = {"pre", "textarea", "script", "style"}
+# Whitespace next to these never renders, so it can go entirely
+_BLOCK_TAGS = {
+    "html", "head", "body", "title", "meta", "link", "style", "script", "nav", "section", "footer", "header",
+    "main", "div", "p", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "img", "br",
+}
+
+
+def minify_css(css: str) -> str:
+    """Drops comments and insignificant whitespace; quoted strings are left alone."""
+    out = []
+    for i, part in enumerate(_CSS_STRING_RE.split(_CSS_COMMENT_RE.sub("", css))):
+        if i % 2:
+            out.append(part)
+            continue
+        part = _CSS_SPACE_RE.sub(" ", part)
+        part = _CSS_PUNCT_RE.sub(r"\1", part)
+        out.append(_CSS_COLON_RE.sub(":", part))
+    return "".join(out).replace(";}", "}").strip()
+
+
+def _tag_name(tag: str) -> str:
+    match = _TAG_NAME_RE.match(tag)
+    return match.group(1).lower() if match else ""
+
+
+def minify_html(html: str) -> str:
+    """
+    Collapses whitespace runs to one space, drops whitespace next to block
+    tags and comments, and minifies <style> contents. <pre>, <textarea>
+    and <script> bodies are only stripped of line indentation.
+    """
+    tokens = _HTML_TOKEN_RE.split(html)
+    out = []
+    raw = None  # name of the raw-text element we are inside
+    for i, token in enumerate(tokens):
+        if not token:
+            continue
+        if i % 2:  # tag or comment
+            if token.startswith("<!--"):
+                continue
+            name = _tag_name(token)
+            if raw is None and name in _RAW_TAGS and not token.startswith("</"):
+                raw = name
+            elif raw == name and token.startswith("</"):
+                raw = None
+            out.append(token)
+            continue
+        if raw == "style":
+            out.append(minify_css(token))
+        elif raw is not None:
+            out.append("\n".join(line.strip() for line in token.splitlines() if line.strip()) if raw == "script" else token)
+        else:
+            text = _HTML_SPACE_RE.sub(" ", token)
+            if text == " ":
+                prev_tag = _tag_name(tokens[i - 1]) if i > 0 else "html"
+                next_tag = _tag_name(tokens[i + 1]) if i + 1 < len(tokens) else "html"
+                if prev_tag in _BLOCK_TAGS or next_tag in _BLOCK_TAGS or not (prev_tag and next_tag):
+                    continue
+            out.append(text)
+    return "".join(out).strip()
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    if encoding == "identity":
+        return content
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def negotiate_encoding(accept_encoding: str, available=ENCODINGS) -> str:
+    """Best encoding in `available` the Accept-Encoding header allows (q > 0), else "identity"."""
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    for encoding in available:
+        if accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return "identity"
+
+
+class OutputOptimizer:
+    """
+    Final stage for generated HTML: minify, then precompress. Keeps running
+    byte totals per stage so the savings can be reported.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # Counters
+        self.documents = 0
+        self.bytes_raw = 0
+        self.bytes_minified = 0
+        self.bytes_encoded = {encoding: 0 for encoding in ENCODINGS}
+        self.documents_encoded = {encoding: 0 for encoding in ENCODINGS}
+
+    def minify(self, html: str) -> bytes:
+        raw = html.encode("utf-8")
+        minified = minify_html(html).encode("utf-8")
+        with self._lock:
+            self.documents += 1
+            self.bytes_raw += len(raw)
+            self.bytes_minified += len(minified)
+        return minified
+
+    def encode(self, content: bytes, encoding: str) -> bytes:
+        encoded = compress(content, encoding)
+        if encoding in self.bytes_encoded:
+            with self._lock:
+                self.bytes_encoded[encoding] += len(encoded)
+                self.documents_encoded[encoding] += 1
+        return encoded
+
+    def variants(self, html: str) -> dict:
+        """{"identity": minified bytes, "gzip": ..., "br": ... (when brotli is installed)}."""
+        minified = self.minify(html)
+        return {"identity": minified, **{e: self.encode(minified, e) for e in ENCODINGS}}
+
+    @staticmethod
+    def report(raw: str, variants: dict) -> dict:
+        """Sizes in bytes and the saving of each variant against the raw HTML."""
+        before = len(raw.encode("utf-8"))
+        return {
+            "raw": before,
+            **{
+                name: {"bytes": len(data), "saved_pct": round((1 - len(data) / before) * 100, 1) if before else 0.0}
+                for name, data in variants.items()
+            },
+        }
+
+    def stats(self) -> dict:
+        return {
+            "brotli": brotli is not None,
+            "documents": self.documents,
+            "bytes_raw": self.bytes_raw,
+            "bytes_minified": self.bytes_minified,
+            "minify_saved_pct": round((1 - self.bytes_minified / self.bytes_raw) * 100, 1) if self.bytes_raw else 0.0,
+            "encoded": {
+                e: {"documents": self.documents_encoded[e], "bytes": self.bytes_encoded[e]}
+                for e in ENCODINGS
+            },
+        }
+
+
+# Shared instance used by the FastAPI app and the Streamlit app
+output_optimizer = OutputOptimizer()
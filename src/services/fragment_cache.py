@@ -0,0 +1,86 @@
+import os
+import threading
+from collections import OrderedDict
+
+# Fragment cache settings (override through environment variables)
+FRAGMENT_CACHE_SIZE = int(os.getenv("FRAGMENT_CACHE_SIZE", "4096"))
+
+
+class FragmentCache:
+    """
+    In-process LRUs of rendered card markup, one per card kind. A card is a
+    pure function of a few string fields, so the fields are the key: a page
+    re-render only re-runs the cards whose fields changed. Thread-safe, since
+    the API thread pool and Streamlit reruns share it.
+    """
+
+    def __init__(self, max_entries: int = FRAGMENT_CACHE_SIZE):
+        self.max_entries = max_entries  # per card kind
+        self._entries = {}  # kind -> OrderedDict of fields -> markup
+        self._lock = threading.Lock()
+
+        # Counters, per card kind
+        self.hits = {}
+        self.misses = {}
+        self.evictions = 0
+
+    def render_sections(self, sections: list) -> list:
+        """
+        sections is [(kind, card, fields list), ...]; returns, per section,
+        [card(*f) for f in fields] with every card whose fields were rendered
+        before taken from the cache. Misses render under the lock as well:
+        a card takes microseconds, and one lock round trip per page is
+        cheaper than two per card.
+        """
+        results = []
+        with self._lock:
+            for kind, card, fields in sections:
+                entries = self._entries.get(kind)
+                if entries is None:
+                    entries = self._entries[kind] = OrderedDict()
+                    self.hits[kind] = self.misses[kind] = 0
+                out = []
+                misses = 0
+                for f in fields:
+                    value = entries.get(f)
+                    if value is None:
+                        value = entries[f] = card(*f)
+                        misses += 1
+                        if len(entries) > self.max_entries:
+                            entries.popitem(last=False)
+                            self.evictions += 1
+                    else:
+                        entries.move_to_end(f)
+                    out.append(value)
+                self.hits[kind] += len(out) - misses
+                self.misses[kind] += misses
+                results.append(out)
+        return results
+
+    def clear(self):
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
+
+    def stats(self) -> dict:
+        def ratio(hits, misses):
+            return round(hits / (hits + misses), 3) if hits + misses else 0.0
+
+        hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        return {
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "max_entries_per_card": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": ratio(hits, misses),
+            "evictions": self.evictions,
+            "by_card": {
+                kind: {"entries": len(self._entries[kind]), "hits": self.hits[kind], "misses": self.misses[kind],
+                       "hit_ratio": ratio(self.hits[kind], self.misses[kind])}
+                for kind in sorted(self._entries)
+            },
+        }
+
+
+# Shared instance used by the portfolio renderer
+fragment_cache = FragmentCache()
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Optional
+
+# Job settings (override through environment variables)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "100"))
+JOB_TTL = float(os.getenv("JOB_TTL", "3600"))
+JOB_STORE_DB = os.getenv("JOB_STORE_DB", "")  # empty = in-process store
+
+TERMINAL_STATES = ("succeeded", "failed")
+SHUTDOWN_ERROR = "Server shut down before the job finished"
+
+
+class QueueFullError(Exception):
+    """Raised by JobQueue.submit when the bounded queue has no room."""
+
+
+# -------------------------------------------------
+# Stores
+# -------------------------------------------------
+
+
+class InMemoryJobStore:
+    """Job records in a dict. Only visible to the process that owns it."""
+
+    def __init__(self, ttl: float = JOB_TTL):
+        self.ttl = ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def create(self, job: dict):
+        with self._lock:
+            self._prune()
+            self._jobs[job["job_id"]] = dict(job)
+
+    def update(self, job_id: str, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl
+        for job_id in [j for j, job in self._jobs.items()
+                       if job["status"] in TERMINAL_STATES and job["finished_at"] < cutoff]:
+            del self._jobs[job_id]
+
+
+class SQLiteJobStore:
+    """Job records in SQLite, so every uvicorn worker can answer status polls."""
+
+    COLUMNS = ("job_id", "kind", "status", "created_at", "started_at", "finished_at", "result", "error")
+
+    def __init__(self, path: str, ttl: float = JOB_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, "
+            "created_at REAL NOT NULL, started_at REAL, finished_at REAL, result TEXT, error TEXT)"
+        )
+        self._db.commit()
+
+    def create(self, job: dict):
+        row = {**job, "result": json.dumps(job.get("result"))}
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*TERMINAL_STATES, time.time() - self.ttl),
+            )
+            self._db.execute(
+                f"INSERT INTO jobs ({', '.join(self.COLUMNS)}) VALUES ({', '.join('?' * len(self.COLUMNS))})",
+                tuple(row.get(c) for c in self.COLUMNS),
+            )
+            self._db.commit()
+
+    def update(self, job_id: str, **fields):
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"])
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._db.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*fields.values(), job_id))
+            self._db.commit()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(zip(self.COLUMNS, row))
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+
+def make_job_store():
+    if JOB_STORE_DB:
+        return SQLiteJobStore(JOB_STORE_DB)
+    return InMemoryJobStore()
+
+
+# -------------------------------------------------
+# Queue + workers
+# -------------------------------------------------
+
+
+class JobQueue:
+    """
+    Bounded queue of generation jobs processed by a fixed pool of asyncio workers.
+
+    Handlers are registered per job kind: `async fn(payload) -> JSON-serialisable result`.
+    Exceptions become failed jobs; `detail` is used when present (HTTPException).
+    """
+
+    def __init__(self, store=None, workers: int = JOB_WORKERS, maxsize: int = JOB_QUEUE_SIZE):
+        self.store = store if store is not None else make_job_store()
+        self.workers = workers
+        self.maxsize = maxsize
+        self.handlers = {}
+        self._queue = None
+        self._tasks = []
+
+        # Counters
+        self.submitted = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.running = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.run_time_total = 0.0
+
+    def register(self, kind: str, handler):
+        self.handlers[kind] = handler
+
+    def start(self):
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """
+        Cancels the workers, then fails every job they left behind: running
+        ones (see _worker) and still-queued ones. A SQLiteJobStore outlives
+        the process, so anything left "queued"/"running" would be polled forever.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while not self._queue.empty():
+            job_id = self._queue.get_nowait()[0]
+            self._queue.task_done()
+            self.failed += 1
+            self.store.update(job_id, status="failed", finished_at=time.time(), error=SHUTDOWN_ERROR)
+
+    def submit(self, kind: str, payload) -> str:
+        if kind not in self.handlers:
+            raise KeyError(kind)
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "status": "queued",
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+        }
+        try:
+            self._queue.put_nowait((job["job_id"], kind, payload, job["created_at"]))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(f"Job queue is full ({self.maxsize} pending)")
+        self.store.create(job)
+        self.submitted += 1
+        return job["job_id"]
+
+    def get(self, job_id: str) -> Optional[dict]:
+        return self.store.get(job_id)
+
+    async def _worker(self):
+        while True:
+            job_id, kind, payload, created_at = await self._queue.get()
+            started_at = time.time()
+            wait = started_at - created_at
+            self.wait_time_total += wait
+            self.wait_time_max = max(self.wait_time_max, wait)
+            self.running += 1
+            self.store.update(job_id, status="running", started_at=started_at)
+            try:
+                result = await self.handlers[kind](payload)
+            except asyncio.CancelledError:
+                self.failed += 1
+                self.store.update(job_id, status="failed", finished_at=time.time(), error=SHUTDOWN_ERROR)
+                raise
+            except Exception as e:
+                self.failed += 1
+                self.store.update(
+                    job_id, status="failed", finished_at=time.time(), error=str(getattr(e, "detail", e))
+                )
+            else:
+                self.succeeded += 1
+                self.store.update(job_id, status="succeeded", finished_at=time.time(), result=result)
+            finally:
+                self.running -= 1
+                self.run_time_total += time.time() - started_at
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        started = self.succeeded + self.failed + self.running
+        finished = self.succeeded + self.failed
+        return {
+            "store": type(self.store).__name__,
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_maxsize": self.maxsize,
+            "running": self.running,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.wait_time_total / started * 1000, 1) if started else 0.0,
+            "max_wait_ms": round(self.wait_time_max * 1000, 1),
+            "avg_run_ms": round(self.run_time_total / finished * 1000, 1) if finished else 0.0,
+        }
+
+
+# Shared instance used by the FastAPI app
+job_queue = JobQueue()
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Cache settings (override through environment variables)
+LLM_CACHE_ENTRIES = int(os.getenv("LLM_CACHE_ENTRIES", "256"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+LLM_CACHE_DB = os.getenv("LLM_CACHE_DB", "")  # empty = memory tier only
+LLM_CACHE_DB_MAX_BYTES = int(os.getenv("LLM_CACHE_DB_MAX_BYTES", str(50 * 1024 * 1024)))
+
+
+def make_cache_key(*parts) -> str:
+    """Content address for an LLM call, e.g. (model, system_prompt, resume_text, job_description)."""
+    blob = json.dumps(parts, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier cache for parsed LLM responses.
+
+    Values are JSON-serialisable dicts; they are stored as JSON text so callers
+    always get a fresh copy back. The memory tier is an LRU bounded by entry
+    count. The optional SQLite tier survives restarts and is bounded by total
+    payload size (least recently used rows go first). Both tiers honour the TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = LLM_CACHE_ENTRIES,
+        ttl: float = LLM_CACHE_TTL,
+        db_path: str = LLM_CACHE_DB,
+        max_db_bytes: int = LLM_CACHE_DB_MAX_BYTES,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_db_bytes = max_db_bytes
+        self._memory = OrderedDict()  # key -> (created, json_text)
+        self._lock = threading.Lock()
+
+        self._db = None
+        self.db_path = db_path or None
+        if self.db_path:
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed)")
+            self._db.commit()
+
+        # Counters
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def _expired(self, created: float, now: float) -> bool:
+        return self.ttl > 0 and now - created > self.ttl
+
+    def get(self, key: str) -> Optional[dict]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created, text = entry
+                if not self._expired(created, now):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(text)
+                del self._memory[key]
+                self.expired += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    text, created = row
+                    if not self._expired(created, now):
+                        self._db.execute("UPDATE llm_cache SET accessed = ? WHERE key = ?", (now, key))
+                        self._db.commit()
+                        self._remember(key, created, text)
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return json.loads(text)
+                    self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self.expired += 1
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: dict):
+        now = time.time()
+        text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._remember(key, now, text)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, text, len(text), now, now),
+                )
+                self._evict_disk(now)
+                self._db.commit()
+
+    def _remember(self, key: str, created: float, text: str):
+        self._memory[key] = (created, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _evict_disk(self, now: float):
+        if self.ttl > 0:
+            cur = self._db.execute("DELETE FROM llm_cache WHERE created < ?", (now - self.ttl,))
+            self.expired += cur.rowcount
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_db_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM llm_cache ORDER BY accessed").fetchall():
+            if total <= self.max_db_bytes:
+                break
+            self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM llm_cache")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            disk_entries = disk_bytes = 0
+            if self._db is not None:
+                disk_entries, disk_bytes = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+                ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "disk_enabled": self._db is not None,
+                "disk_entries": disk_entries,
+                "disk_bytes": disk_bytes,
+                "max_disk_bytes": self.max_db_bytes,
+                "ttl": self.ttl,
+            }
+
+
+# Shared instance for resume enhancement results
+response_cache = ResponseCache()
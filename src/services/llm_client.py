@@ -0,0 +1,243 @@
+import asyncio
+import json
+import os
+import threading
+import weakref
+
+import httpx
+
+from src.services.rate_limit import UpstreamGuard
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Pool settings (override through environment variables)
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "10"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+LLM_HTTP2 = os.getenv("LLM_HTTP2", "1") != "0"
+
+
+class LLMStreamError(Exception):
+    """Upstream error while opening or reading a streamed completion."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(f"{status_code} {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _http2_available() -> bool:
+    # HTTP/2 needs the optional `h2` package (httpx[http2])
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class LLMClient:
+    """
+    Process-wide pooled HTTP client for OpenRouter.
+
+    httpx.AsyncClient is bound to the event loop it was first used on, so we
+    keep one client per running loop. The FastAPI app only has one loop; the
+    Streamlit app runs everything on the background loop from `run_sync`.
+    """
+
+    def __init__(
+        self,
+        timeout: float = LLM_TIMEOUT,
+        max_connections: int = LLM_MAX_CONNECTIONS,
+        max_keepalive: int = LLM_MAX_KEEPALIVE,
+        keepalive_expiry: float = LLM_KEEPALIVE_EXPIRY,
+        http2: bool = LLM_HTTP2,
+        guard: UpstreamGuard = None,
+    ):
+        self.timeout = timeout
+        self.guard = guard or UpstreamGuard()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and _http2_available()
+        self._clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+        # Counters
+        self.requests_total = 0
+        self.errors_total = 0
+        self.in_flight = 0
+        self.clients_created = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    http2=self.http2,
+                    headers={"Content-Type": "application/json"},
+                )
+                self._clients[loop] = client
+                self.clients_created += 1
+        return client
+
+    async def post(self, payload: dict, headers: dict = None, url: str = OPENROUTER_URL) -> httpx.Response:
+        """
+        POST a chat-completion payload over the shared connection pool.
+
+        Rate limiting and retries (429/5xx, Retry-After) are handled by
+        `self.guard`; the last response is returned if retries run out.
+        """
+        client = self._get_client()
+        for attempt in self.guard.attempts():
+            async with self.guard.slot():
+                self.requests_total += 1
+                self.in_flight += 1
+                try:
+                    response = await client.post(url, headers=headers, json=payload)
+                except Exception:
+                    self.errors_total += 1
+                    raise
+                finally:
+                    self.in_flight -= 1
+            delay = self.guard.retry_delay(response.status_code, response.headers, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+
+    async def stream(self, payload: dict, headers: dict = None, url: str = OPENROUTER_URL):
+        """
+        Async generator over the content deltas of a `stream: true` completion.
+
+        OpenRouter sends SSE lines (`data: {...}`), keep-alive comments
+        (`: OPENROUTER PROCESSING`) and a final `data: [DONE]`. Opening the
+        stream is retried like `post`; the concurrency permit is held until
+        the stream ends.
+        """
+        client = self._get_client()
+        for attempt in self.guard.attempts():
+            async with self.guard.slot():
+                self.requests_total += 1
+                self.in_flight += 1
+                try:
+                    async with client.stream("POST", url, headers=headers, json={**payload, "stream": True}) as response:
+                        if response.status_code == 200:
+                            self.guard.retry_delay(response.status_code, response.headers, attempt)
+                            async for delta in self._iter_deltas(response):
+                                yield delta
+                            return
+
+                        body = await response.aread()
+                        delay = self.guard.retry_delay(response.status_code, response.headers, attempt)
+                        if delay is None:
+                            raise LLMStreamError(response.status_code, body.decode("utf-8", "replace"))
+                except Exception:
+                    self.errors_total += 1
+                    raise
+                finally:
+                    self.in_flight -= 1
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _iter_deltas(response: httpx.Response):
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            chunk = json.loads(data)
+            if "error" in chunk:
+                error = chunk["error"]
+                raise LLMStreamError(error.get("code", 500), error.get("message", str(error)))
+            choices = chunk.get("choices") or [{}]
+            delta = (choices[0].get("delta") or {}).get("content")
+            if delta:
+                yield delta
+
+    async def aclose(self):
+        """Close the client bound to the current event loop (lifespan shutdown)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def stats(self) -> dict:
+        connections = []
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            # httpx does not expose the pool publicly; read it defensively
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections.extend(getattr(pool, "connections", []) or [])
+
+        idle = sum(1 for c in connections if c.is_idle())
+        return {
+            "http2": self.http2,
+            "timeout": self.timeout,
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+            "clients": len(clients),
+            "clients_created": self.clients_created,
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "in_flight": self.in_flight,
+            "pool": {
+                "connections": len(connections),
+                "idle": idle,
+                "active": len(connections) - idle,
+            },
+        }
+
+
+# Shared instance used by the FastAPI backend and the Streamlit front end
+llm_client = LLMClient()
+
+
+# -------------------------------------------------
+# Sync bridge for Streamlit
+# -------------------------------------------------
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-client-loop", daemon=True).start()
+    return _loop
+
+
+def run_sync(coro):
+    """
+    Run a coroutine on the long-lived background loop and wait for the result.
+
+    Use this instead of `asyncio.run(...)`, which creates a new loop (and so a
+    new connection pool) on every call.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+
+def iter_sync(agen):
+    """Iterate an async generator from sync code (e.g. `st.write_stream`) on the background loop."""
+    loop = _background_loop()
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
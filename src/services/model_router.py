@@ -0,0 +1,179 @@
+import asyncio
+import os
+import time
+from collections import deque
+
+# Routing settings (override through environment variables)
+LLM_HEDGING = os.getenv("LLM_HEDGING", "1") != "0"
+LLM_HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.9"))
+LLM_HEDGE_DELAY = float(os.getenv("LLM_HEDGE_DELAY", "15"))  # until a model has enough samples
+LLM_EWMA_ALPHA = float(os.getenv("LLM_EWMA_ALPHA", "0.2"))
+LLM_UNHEALTHY_ERROR_RATE = float(os.getenv("LLM_UNHEALTHY_ERROR_RATE", "0.5"))
+
+MIN_SAMPLES = 5
+
+
+class ModelStats:
+    def __init__(self, name: str, alpha: float):
+        self.name = name
+        self.alpha = alpha
+        self.latency_ewma = None
+        self.error_ewma = 0.0
+        self.latencies = deque(maxlen=100)
+        self.requests = 0
+        self.errors = 0
+        self.wins = 0
+        self.hedges = 0
+
+    def record_success(self, latency: float):
+        self.requests += 1
+        self.latencies.append(latency)
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += self.alpha * (latency - self.latency_ewma)
+        self.error_ewma *= 1 - self.alpha
+
+    def record_lost(self, elapsed: float):
+        # Cancelled after another model won: its latency is at least `elapsed`
+        if self.latency_ewma is None or elapsed > self.latency_ewma:
+            self.latency_ewma = elapsed if self.latency_ewma is None else (
+                self.latency_ewma + self.alpha * (elapsed - self.latency_ewma)
+            )
+
+    def record_error(self):
+        self.requests += 1
+        self.errors += 1
+        self.error_ewma += self.alpha * (1 - self.error_ewma)
+
+    def percentile(self, p: float):
+        if len(self.latencies) < MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(p * (len(ordered) - 1))]
+
+    def stats(self) -> dict:
+        p50 = self.percentile(0.5)
+        p90 = self.percentile(0.9)
+        return {
+            "latency_ewma_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            "error_ewma": round(self.error_ewma, 3),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p90_ms": round(p90 * 1000, 1) if p90 is not None else None,
+            "requests": self.requests,
+            "errors": self.errors,
+            "wins": self.wins,
+            "hedges": self.hedges,
+        }
+
+
+class ModelRouter:
+    """
+    Routes a completion over a pool of equivalent models.
+
+    Models are ranked healthy-first, then by latency EWMA (models without
+    samples keep their configured order after the measured ones). `call`
+    sends to the best model; if it has not answered by that model's
+    `hedge_percentile` latency, the next model is fired too and the first
+    valid answer wins. A failed call fails over to the next model at once.
+    """
+
+    def __init__(
+        self,
+        models: list,
+        hedging: bool = LLM_HEDGING,
+        hedge_percentile: float = LLM_HEDGE_PERCENTILE,
+        default_hedge_delay: float = LLM_HEDGE_DELAY,
+        alpha: float = LLM_EWMA_ALPHA,
+        unhealthy_error_rate: float = LLM_UNHEALTHY_ERROR_RATE,
+    ):
+        self.models = list(models)
+        self.hedging = hedging
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.unhealthy_error_rate = unhealthy_error_rate
+        self._stats = {m: ModelStats(m, alpha) for m in self.models}
+
+    def ranked(self) -> list:
+        def score(item):
+            order, model = item
+            s = self._stats[model]
+            unhealthy = s.error_ewma >= self.unhealthy_error_rate
+            unmeasured = s.latency_ewma is None
+            return (unhealthy, unmeasured, s.latency_ewma or 0.0, order)
+
+        return [m for _, m in sorted(enumerate(self.models), key=score)]
+
+    def pick(self) -> str:
+        return self.ranked()[0]
+
+    def hedge_delay(self, model: str) -> float:
+        p = self._stats[model].percentile(self.hedge_percentile)
+        return p if p is not None else self.default_hedge_delay
+
+    async def call(self, request_fn, passthrough=()):
+        """
+        request_fn(model) -> coroutine returning a validated result, raising on
+        any failure. Exceptions in `passthrough` (e.g. local load shedding) are
+        not counted against the model. They are re-raised when nothing else is
+        running; a shed hedge is dropped and the call keeps waiting on the
+        model already running, without hedging again.
+        """
+        candidates = self.ranked()
+        pending = {}  # task -> (model, started)
+        last_error = None
+        hedging = self.hedging
+
+        def launch():
+            model = candidates.pop(0)
+            task = asyncio.ensure_future(request_fn(model))
+            pending[task] = (model, time.perf_counter())
+            return model
+
+        try:
+            primary = launch()
+            hedge_at = time.perf_counter() + self.hedge_delay(primary)
+            while pending:
+                timeout = None
+                if hedging and candidates and len(pending) == 1:
+                    timeout = max(0.0, hedge_at - time.perf_counter())
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # Slow answer: race the next model against it
+                    self._stats[launch()].hedges += 1
+                    continue
+
+                for task in done:
+                    model, started = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self._stats[model].record_success(time.perf_counter() - started)
+                        self._stats[model].wins += 1
+                        now = time.perf_counter()
+                        for other, other_started in pending.values():
+                            self._stats[other].record_lost(now - other_started)
+                        return task.result()
+                    if isinstance(error, passthrough):
+                        if not pending:
+                            raise error
+                        hedging = False  # shed under load: another hedge would be too
+                        continue
+                    self._stats[model].record_error()
+                    last_error = error
+
+                # Fail over straight away if nothing else is running
+                if not pending and candidates:
+                    hedge_at = time.perf_counter() + self.hedge_delay(launch())
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "hedging": self.hedging,
+            "hedge_percentile": self.hedge_percentile,
+            "ranking": self.ranked(),
+            "models": {m: s.stats() for m, s in self._stats.items()},
+        }
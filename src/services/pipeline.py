@@ -0,0 +1,154 @@
+import asyncio
+import time
+
+
+class StageTimer:
+    """Per-stage wall-clock timings, in ms relative to the start of the pipeline."""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self.stages = {}
+
+    def _now_ms(self) -> float:
+        return round((time.perf_counter() - self._t0) * 1000, 1)
+
+    async def run(self, name: str, coro):
+        start = self._now_ms()
+        try:
+            return await coro
+        finally:
+            end = self._now_ms()
+            self.stages[name] = {"start_ms": start, "end_ms": end, "duration_ms": round(end - start, 1)}
+
+    def summary(self) -> dict:
+        return {**self.stages, "total": {"start_ms": 0.0, "end_ms": self._now_ms(), "duration_ms": self._now_ms()}}
+
+
+async def run_pipeline(enhance, cover_letter=None, derived=None):
+    """
+    Runs a full generation with concurrent fan-out.
+
+    enhance / cover_letter: zero-arg coroutine functions, started together.
+    derived: {stage_name: fn(enhanced)} of blocking functions (portfolio HTML,
+             PDF/DOCX rendering). Each one starts in a worker thread the
+             moment `enhance` returns, while the cover letter may still be
+             in flight.
+
+    Returns (results, timings); results has "enhanced", "cover_letter" and one
+    key per derived stage. If any stage fails the others are cancelled and
+    the exception propagates.
+    """
+    timer = StageTimer()
+    derived = derived or {}
+
+    async def enhance_and_derive():
+        enhanced = await timer.run("enhance", enhance())
+        outputs = await asyncio.gather(*[
+            timer.run(name, asyncio.to_thread(fn, enhanced)) for name, fn in derived.items()
+        ])
+        return enhanced, dict(zip(derived, outputs))
+
+    tasks = [asyncio.ensure_future(enhance_and_derive())]
+    if cover_letter is not None:
+        tasks.append(asyncio.ensure_future(timer.run("cover_letter", cover_letter())))
+
+    try:
+        outputs = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    enhanced, derived_results = outputs[0]
+    results = {
+        "enhanced": enhanced,
+        "cover_letter": outputs[1] if cover_letter is not None else None,
+        **derived_results,
+    }
+    return results, timer.summary()
+
+
+# -------------------------------------------------
+# Enhanced resume -> renderer input shapes
+# -------------------------------------------------
+
+
+def resume_data_from_enhanced(enhanced: dict) -> dict:
+    """GenAIEnhanceResponse dict -> the dict shape ResumePDFGenerator / ResumeDOCXGenerator read."""
+    contact = enhanced.get("contact") or {}
+    return {
+        "name": contact.get("name", ""),
+        "email": contact.get("email", ""),
+        "phone": contact.get("phone"),
+        "linkedin": contact.get("linkedin"),
+        "github": contact.get("github"),
+        "professional_summary": enhanced.get("summary", ""),
+        "education": enhanced.get("education", []),
+        "experience": [
+            {
+                "role": e.get("title", ""),
+                "company": e.get("company", ""),
+                "location": e.get("location", ""),
+                "period": e.get("period", ""),
+                "description": e.get("bullets", []),
+            }
+            for e in enhanced.get("experience", [])
+        ],
+        "projects": [
+            {
+                "title": p.get("name", ""),
+                "duration": p.get("period", ""),
+                "tech_stack": p.get("tech_stack", []),
+                "description": p.get("bullets", []),
+            }
+            for p in enhanced.get("projects", [])
+        ],
+        "skills": {
+            "technical": enhanced.get("technical_skills") or enhanced.get("skills", []),
+            "soft": enhanced.get("soft_skills", []),
+        },
+        "certifications": [
+            {k: v or "" for k, v in c.items()} if isinstance(c, dict) else c
+            for c in enhanced.get("certifications", [])
+        ],
+    }
+
+
+def portfolio_data_from_enhanced(enhanced: dict) -> dict:
+    """GenAIEnhanceResponse dict -> the dict shape generate_portfolio_html reads (see app.build_portfolio_data)."""
+    contact = enhanced.get("contact") or {}
+    return {
+        "hero_name": contact.get("name", ""),
+        "hero_title": enhanced.get("summary", ""),
+        "hero_summary": enhanced.get("summary", ""),
+        "about_me": enhanced.get("summary", ""),
+        "education": enhanced.get("education", []),
+        "experience": [
+            {
+                "title": e.get("title", ""),
+                "company": e.get("company", ""),
+                "period": e.get("period", ""),
+                "bullets": e.get("bullets", []),
+            }
+            for e in enhanced.get("experience", [])
+        ],
+        "projects": [
+            {
+                "name": p.get("name", ""),
+                "duration": p.get("period", ""),
+                "tech_stack": p.get("tech_stack", []),
+                "highlights": p.get("bullets", []),
+                "github_link": "",
+            }
+            for p in enhanced.get("projects", [])
+        ],
+        "skills": (enhanced.get("technical_skills") or []) + (enhanced.get("soft_skills") or []),
+        "certifications": [
+            {"name": c.get("name", ""), "issuer": c.get("issuing_authority") or "", "date": c.get("issue_date") or ""}
+            if isinstance(c, dict) else c
+            for c in enhanced.get("certifications", [])
+        ],
+        "contact_email": contact.get("email", ""),
+        "contact_linkedin": contact.get("linkedin") or "",
+        "contact_github": contact.get("github") or "",
+    }
@@ -0,0 +1,256 @@
+import json
+import re
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+except Exception:  # optional: fall back to a heuristic count
+    _ENCODING = None
+
+# Words, numbers and single punctuation marks: within ~10-15% of BPE counts
+# for English resume text, which is enough to compare prompt variants.
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_BULLET_RE = re.compile(r"^\s*(?:[-*•‣◦⁃]|\d+[.)])\s*")
+_SPACES_RE = re.compile(r"[ \t]+")
+
+# Lines shorter than this are never deduped ("Remote", "Python", dates)
+MIN_DEDUPE_WORDS = 4
+
+# Shape of the enhancement answer (see schemas.GenAIEnhanceResponse)
+RESUME_SCHEMA = {
+    "contact": {"name": "str", "phone": "str", "email": "str", "linkedin": "str|null", "github": "str|null"},
+    "summary": "str",
+    "education": [{"institution": "str", "location": "str", "degree": "str", "period": "str"}],
+    "experience": [{"company": "str", "title": "str", "location": "str", "period": "str", "bullets": ["str"]}],
+    "projects": [{"name": "str", "tech_stack": ["str"], "period": "str", "bullets": ["str"]}],
+    "skills": ["str"],
+    "technical_skills": ["str"],
+    "soft_skills": ["str"],
+    "certifications": [
+        {"name": "str", "issuing_authority": "str", "issue_date": "str", "certificate_id": "str"}
+    ],
+}
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return len(_TOKEN_RE.findall(text))
+
+
+def schema_prompt(schema: dict, role: str = "an expert resume writer") -> str:
+    """System prompt that states the answer schema as one compact JSON skeleton."""
+    return (
+        f"You are {role}. Reply with ONLY a JSON object (no prose, no code fences) "
+        "matching this schema; lists may be empty:\n"
+        + json.dumps(schema, separators=(",", ":"))
+    )
+
+
+class PromptBuilder:
+    """
+    Turns the Streamlit profile into a compact canonical resume text for the
+    LLM and tidies free-form resume text sent to the API.
+
+    The canonical form is labelled plain text: empty fields and blank rows
+    are dropped, bullets lose their markers, skills are comma-joined and
+    repeated lines/bullets/skills are kept once. Counts raw vs. compact
+    tokens for every prompt it builds.
+    """
+
+    def __init__(self):
+        # Counters
+        self.prompts = 0
+        self.tokens_raw = 0
+        self.tokens_compact = 0
+
+    # ---------- structured profile ----------
+
+    def profile_text(self, profile: dict) -> str:
+        """
+        profile: name, email, phone, linkedin, github, summary, education
+        (text or list), experience / projects (app.py row dicts), skills
+        ({"technical": [...], "soft": [...]} or text), certifications.
+        """
+        seen = set()
+        lines = []
+
+        header = " | ".join(
+            v.strip() for v in (profile.get(k) or "" for k in ("email", "phone", "linkedin", "github")) if v.strip()
+        )
+        for value in (profile.get("name"), header):
+            if value and value.strip():
+                lines.append(value.strip())
+
+        summary = _collapse(profile.get("summary") or "")
+        if summary:
+            lines += ["", "SUMMARY", summary]
+
+        education = self._lines(profile.get("education"), seen)
+        if education:
+            lines += ["", "EDUCATION"] + [f"- {e}" for e in education]
+
+        experience = []
+        for row in profile.get("experience") or []:
+            if isinstance(row, str):
+                experience += [f"- {line}" for line in self._lines(row, seen)]
+                continue
+            role, company = _collapse(row.get("role") or row.get("title") or ""), _collapse(row.get("company") or "")
+            bullets = self._lines(row.get("description") or row.get("bullets"), seen)
+            if not (role or company or bullets):
+                continue
+            period = _period(row)
+            head = " @ ".join(p for p in (role, company) if p)
+            experience.append(f"- {head} ({period})" if period else f"- {head}")
+            experience += [f"  * {b}" for b in bullets]
+        if experience:
+            lines += ["", "EXPERIENCE"] + experience
+
+        projects = []
+        for row in profile.get("projects") or []:
+            if isinstance(row, str):
+                projects += [f"- {line}" for line in self._lines(row, seen)]
+                continue
+            title = _collapse(row.get("title") or row.get("name") or "")
+            bullets = self._lines(row.get("description") or row.get("bullets"), seen)
+            if not (title or bullets):
+                continue
+            head = title
+            if row.get("duration") or row.get("period"):
+                head += f" ({_collapse(row.get('duration') or row.get('period'))})"
+            tech = _dedupe_items(_split_items(row.get("tech_stack")))
+            if tech:
+                head += f" [{', '.join(tech)}]"
+            if row.get("github_link"):
+                head += f" {row['github_link'].strip()}"
+            projects.append(f"- {head}")
+            projects += [f"  * {b}" for b in bullets]
+        if projects:
+            lines += ["", "PROJECTS"] + projects
+
+        skills = profile.get("skills") or {}
+        if not isinstance(skills, dict):
+            skills = {"technical": skills}
+        for label, key in (("TECHNICAL SKILLS", "technical"), ("SOFT SKILLS", "soft")):
+            items = _dedupe_items(_split_items(skills.get(key)))
+            if items:
+                lines += ["", label, ", ".join(items)]
+
+        certifications = self._lines(profile.get("certifications"), seen)
+        if certifications:
+            lines += ["", "CERTIFICATIONS"] + [f"- {c}" for c in certifications]
+
+        text = "\n".join(lines).strip()
+        self._record(_raw_profile_text(profile), text)
+        return text
+
+    def _lines(self, value, seen: set) -> list:
+        """Text or list -> cleaned lines, skipping ones already used elsewhere in the prompt."""
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split("\n")
+        out = []
+        for item in value:
+            if isinstance(item, dict):
+                item = ", ".join(str(v) for v in item.values() if v)
+            line = _collapse(_BULLET_RE.sub("", str(item)))
+            if not line:
+                continue
+            if len(line.split()) >= MIN_DEDUPE_WORDS:
+                norm = line.lower().rstrip(".")
+                if norm in seen:
+                    continue
+                seen.add(norm)
+            out.append(line)
+        return out
+
+    # ---------- free-form text ----------
+
+    def compact_text(self, text: str) -> str:
+        """Collapses whitespace and blank-line runs and drops repeated long lines."""
+        seen = set()
+        out = []
+        for raw in (text or "").split("\n"):
+            line = _collapse(raw)
+            if not line:
+                if out and out[-1]:
+                    out.append("")
+                continue
+            if len(line.split()) >= MIN_DEDUPE_WORDS:
+                norm = line.lower()
+                if norm in seen:
+                    continue
+                seen.add(norm)
+            out.append(line)
+        compact = "\n".join(out).strip()
+        self._record(text or "", compact)
+        return compact
+
+    # ---------- reporting ----------
+
+    def _record(self, raw: str, compact: str):
+        self.prompts += 1
+        self.tokens_raw += estimate_tokens(raw)
+        self.tokens_compact += estimate_tokens(compact)
+
+    @staticmethod
+    def report(raw: str, compact: str) -> dict:
+        before, after = estimate_tokens(raw), estimate_tokens(compact)
+        return {
+            "tokens_before": before,
+            "tokens_after": after,
+            "saved_pct": round((1 - after / before) * 100, 1) if before else 0.0,
+        }
+
+    def stats(self) -> dict:
+        return {
+            "tokenizer": "tiktoken" if _ENCODING is not None else "heuristic",
+            "prompts": self.prompts,
+            "tokens_raw": self.tokens_raw,
+            "tokens_compact": self.tokens_compact,
+            "saved_pct": round((1 - self.tokens_compact / self.tokens_raw) * 100, 1) if self.tokens_raw else 0.0,
+        }
+
+
+def _collapse(text: str) -> str:
+    return _SPACES_RE.sub(" ", str(text)).strip()
+
+
+def _split_items(value) -> list:
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.replace("\n", ",").split(",")
+    return [_collapse(_BULLET_RE.sub("", str(v))) for v in value]
+
+
+def _dedupe_items(items: list) -> list:
+    seen = set()
+    out = []
+    for item in items:
+        key = item.lower()
+        if item and key not in seen:
+            seen.add(key)
+            out.append(item)
+    return out
+
+
+def _period(row: dict) -> str:
+    if row.get("period"):
+        return _collapse(row["period"])
+    start = row.get("start_date") or ""
+    end = "Present" if row.get("still_working") else (row.get("end_date") or "")
+    return f"{start} - {end}" if start else ""
+
+
+def _raw_profile_text(profile: dict) -> str:
+    # The repr-based text app.py used to send; the "before" side of the report
+    return "\n\n".join(f"{k}\n{v}" for k, v in profile.items())
+
+
+# Shared instance used by the API and the Streamlit app
+prompt_builder = PromptBuilder()
@@ -0,0 +1,256 @@
+import asyncio
+import os
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Limiter settings (override through environment variables)
+LLM_RATE_PER_SEC = float(os.getenv("LLM_RATE_PER_SEC", "2"))
+LLM_BURST = int(os.getenv("LLM_BURST", "5"))
+LLM_CONCURRENCY_INITIAL = int(os.getenv("LLM_CONCURRENCY_INITIAL", "4"))
+LLM_CONCURRENCY_MIN = int(os.getenv("LLM_CONCURRENCY_MIN", "1"))
+LLM_CONCURRENCY_MAX = int(os.getenv("LLM_CONCURRENCY_MAX", "16"))
+LLM_MAX_QUEUE = int(os.getenv("LLM_MAX_QUEUE", "32"))
+LLM_QUEUE_TIMEOUT = float(os.getenv("LLM_QUEUE_TIMEOUT", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "1"))
+LLM_BACKOFF_CAP = float(os.getenv("LLM_BACKOFF_CAP", "20"))
+
+RETRYABLE_STATUS = (429, 502, 503, 504)
+
+
+class LLMOverloadedError(Exception):
+    """Request shed locally because too many OpenRouter calls are already waiting."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Smooths the request rate to `rate` per second with bursts of up to `burst`."""
+
+    def __init__(self, rate: float = LLM_RATE_PER_SEC, burst: int = LLM_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def pause_for(self, seconds: float):
+        """Upstream asked us to back off (Retry-After): nobody gets a token before then."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "rate_per_sec": self.rate,
+            "burst": self.burst,
+            "tokens": round(self.tokens, 2),
+            "paused_for_s": round(max(0.0, self._paused_until - now), 2),
+        }
+
+
+class AIMDLimiter:
+    """
+    Adaptive concurrency limit: +1 permit per window of successes, halved on
+    an upstream overload signal (429/5xx). Callers beyond the limit wait in a
+    bounded FIFO; when it is full, or the wait exceeds `queue_timeout`, the
+    call is shed with LLMOverloadedError.
+    """
+
+    def __init__(
+        self,
+        initial: int = LLM_CONCURRENCY_INITIAL,
+        minimum: int = LLM_CONCURRENCY_MIN,
+        maximum: int = LLM_CONCURRENCY_MAX,
+        max_queue: int = LLM_MAX_QUEUE,
+        queue_timeout: float = LLM_QUEUE_TIMEOUT,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_use = 0
+        self._waiters = deque()
+
+        # Counters
+        self.rejected = 0
+        self.timeouts = 0
+        self.increases = 0
+        self.decreases = 0
+
+    def _has_room(self) -> bool:
+        return self.in_use < int(self.limit)
+
+    def _wake(self):
+        while self._waiters and self._has_room():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_use += 1
+                waiter.set_result(None)
+
+    @asynccontextmanager
+    async def permit(self):
+        if self._has_room() and not self._waiters:
+            self.in_use += 1
+        else:
+            if len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                raise LLMOverloadedError(f"{len(self._waiters)} OpenRouter calls already queued")
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+            except BaseException as e:
+                # Timed out or cancelled (client went away)
+                if waiter.done():
+                    # Granted just as we gave up; hand the permit back
+                    self.in_use -= 1
+                    self._wake()
+                else:
+                    waiter.cancel()
+                    self._waiters.remove(waiter)
+                if isinstance(e, asyncio.TimeoutError):
+                    self.timeouts += 1
+                    raise LLMOverloadedError(f"Waited {self.queue_timeout:.0f}s for an OpenRouter slot")
+                raise
+        try:
+            yield
+        finally:
+            self.in_use -= 1
+            self._wake()
+
+    def on_success(self):
+        if self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.increases += 1
+            self._wake()
+
+    def on_overload(self):
+        self.limit = max(self.minimum, self.limit / 2)
+        self.decreases += 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "min": self.minimum,
+            "max": self.maximum,
+            "in_use": self.in_use,
+            "queued": len(self._waiters),
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class UpstreamGuard:
+    """
+    Everything between us and OpenRouter's rate limits: a token bucket for
+    request rate, an AIMD limiter for concurrency, and retries with jittered
+    exponential backoff that honour Retry-After.
+
+        for attempt in guard.attempts():
+            async with guard.slot():
+                response = await send()
+            delay = guard.retry_delay(response.status_code, response.headers, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket = None,
+        limiter: AIMDLimiter = None,
+        max_retries: int = LLM_MAX_RETRIES,
+        backoff_base: float = LLM_BACKOFF_BASE,
+        backoff_cap: float = LLM_BACKOFF_CAP,
+    ):
+        self.bucket = bucket or TokenBucket()
+        self.limiter = limiter or AIMDLimiter()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+        # Counters
+        self.retries = 0
+        self.throttled = 0
+        self.gave_up = 0
+
+    def attempts(self):
+        return range(self.max_retries + 1)
+
+    @asynccontextmanager
+    async def slot(self):
+        await self.bucket.acquire()
+        async with self.limiter.permit():
+            yield
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: uniform in [0, min(cap, base * 2^attempt)]
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def retry_delay(self, status_code: int, headers, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the response should be returned as is."""
+        if status_code not in RETRYABLE_STATUS:
+            self.limiter.on_success()
+            return None
+
+        self.limiter.on_overload()
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        if status_code == 429:
+            self.throttled += 1
+            if retry_after is not None:
+                self.bucket.pause_for(retry_after)
+
+        if attempt >= self.max_retries:
+            self.gave_up += 1
+            return None
+        self.retries += 1
+        if retry_after is not None:
+            return retry_after + random.uniform(0, 0.1 * retry_after + 0.1)
+        return self.backoff(attempt)
+
+    def stats(self) -> dict:
+        return {
+            "bucket": self.bucket.stats(),
+            "concurrency": self.limiter.stats(),
+            "max_retries": self.max_retries,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "gave_up": self.gave_up,
+        }
@@ -0,0 +1,161 @@
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Render cache settings (override through environment variables)
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+RENDER_PREFETCH_WORKERS = int(os.getenv("RENDER_PREFETCH_WORKERS", "2"))
+
+# Bump whenever a generator's output changes for the same input
+RENDER_VERSION = "4"
+
+
+def render_key(kind: str, data, template: str = "default") -> str:
+    """
+    Stable content address for a rendered document, "<kind>-<sha256 hex>":
+    key order, tuples vs. lists and non-JSON scalars (dates) do not change
+    the hash. The kind prefix lets key_kind tell what a bare key holds.
+    """
+    blob = json.dumps(
+        [kind, template, RENDER_VERSION, data],
+        sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str,
+    )
+    return f"{kind}-{hashlib.sha256(blob.encode('utf-8')).hexdigest()}"
+
+
+_KEY_RE = re.compile(r"(.+)-[0-9a-f]{64}")
+
+
+def key_kind(key: str):
+    """The kind a render_key was made for, or None when `key` is not one (e.g. a "<key>.gzip" variant)."""
+    match = _KEY_RE.fullmatch(key)
+    return match.group(1) if match else None
+
+
+class RenderCache:
+    """
+    In-process LRU of rendered documents (PDF / DOCX / HTML bytes), bounded
+    by total size. Thread-safe: Streamlit reruns, the API thread pool and
+    background prefetches all share it.
+    """
+
+    def __init__(self, max_bytes: int = RENDER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()  # key -> bytes
+        self._inflight = {}  # key -> Future of a render in progress
+        self._lock = threading.Lock()
+        self._executor = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetches = 0
+        self.render_time_total = 0.0
+
+    def get(self, key: str):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: bytes):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._entries[key] = value
+            self.bytes += len(value)
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+                self.evictions += 1
+
+    def peek(self, kind: str, data, template: str = "default"):
+        """Cached bytes or None, without rendering (and without counting a miss)."""
+        with self._lock:
+            return self._entries.get(render_key(kind, data, template))
+
+    def get_or_render(self, kind: str, data, render, template: str = "default") -> bytes:
+        """
+        Cached bytes for (kind, data, template). On a miss, waits for a
+        prefetch of the same key if one is running, else calls render(data).
+        """
+        key = render_key(kind, data, template)
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            future = self._inflight.get(key)
+        if future is not None:
+            return future.result()
+        return self._render(key, data, render)
+
+    def prefetch(self, kind: str, data, render, template: str = "default"):
+        """
+        Renders in a background thread so a later get_or_render / peek finds
+        the bytes ready. `data` is snapshotted first, so callers may keep
+        mutating theirs. Returns the Future, or None if already cached.
+        """
+        key = render_key(kind, data, template)
+        with self._lock:
+            if key in self._entries:
+                return None
+            if key in self._inflight:
+                return self._inflight[key]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(RENDER_PREFETCH_WORKERS, thread_name_prefix="render-prefetch")
+            future = self._executor.submit(self._render, key, copy.deepcopy(data), render)
+            self._inflight[key] = future
+            self.prefetches += 1
+        future.add_done_callback(lambda _: self._forget(key, future))
+        return future
+
+    def _forget(self, key: str, future):
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _render(self, key: str, data, render) -> bytes:
+        started = time.perf_counter()
+        value = render(data)
+        self.render_time_total += time.perf_counter() - started
+        self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "prefetches": self.prefetches,
+            "rendering": len(self._inflight),
+            "render_time_total_ms": round(self.render_time_total * 1000, 1),
+        }
+
+
+# Shared instance used by the Streamlit app and the FastAPI app
+render_cache = RenderCache()
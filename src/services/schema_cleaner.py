@@ -0,0 +1,83 @@
+from typing import Annotated, Optional, Union, get_args, get_origin
+
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field, create_model
+
+from src.services.sanitize import sanitize_text_for_pdf
+
+CleanStr = Annotated[str, AfterValidator(sanitize_text_for_pdf)]
+
+
+def _clean_annotation(annotation, lenient: bool, cache: dict):
+    """str -> CleanStr, models -> their cleaning subclass; recurses through List / Optional."""
+    if annotation is str:
+        return CleanStr
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return cleaning_model(annotation, lenient=lenient, cache=cache)
+    origin = get_origin(annotation)
+    if origin is list:
+        (item,) = get_args(annotation)
+        return list[_clean_annotation(item, lenient, cache)]
+    if origin is Union:
+        args = tuple(_clean_annotation(a, lenient, cache) for a in get_args(annotation))
+        return Optional[args[0]] if len(args) == 2 and type(None) in args else Union[args]
+    return annotation
+
+
+def _empty_default(annotation):
+    """What a missing field becomes in lenient mode: "", [], None or an all-default model."""
+    if annotation is str or annotation is CleanStr:
+        return Field(default="")
+    if get_origin(annotation) is list:
+        return Field(default_factory=list)
+    if get_origin(annotation) is Union and type(None) in get_args(annotation):
+        return Field(default=None)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return Field(default_factory=annotation)
+    return ...
+
+
+def _null_as_empty(annotation):
+    """Lenient mode: an explicit null ("summary": null) becomes "", [] or an all-default model as well."""
+    if annotation is str or annotation is CleanStr:
+        empty = str
+    elif get_origin(annotation) is list:
+        empty = list
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        empty = annotation
+    else:
+        return annotation
+    return Annotated[annotation, BeforeValidator(lambda value: empty() if value is None else value)]
+
+
+def cleaning_model(model: type, skip: tuple = (), lenient: bool = False, cache: dict = None) -> type:
+    """
+    Subclass of `model` whose string fields (at any depth) are sanitized by
+    pydantic while it validates, so parsing the LLM's JSON and cleaning it
+    for the PDF generator is a single pass with no intermediate dicts.
+
+    Instances are still `model` instances (FastAPI response models, caches
+    and isinstance checks are unaffected). Top-level fields in `skip` are
+    validated as declared but left as the model returned them. With
+    `lenient`, fields the model left out or set to null become "", [] or
+    None instead of failing validation (use model_dump(exclude_unset=True)
+    to tell left-out fields apart).
+    """
+    cache = {} if cache is None else cache
+    if model in cache:
+        return cache[model]
+    overrides = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if name not in skip:
+            annotation = _clean_annotation(annotation, lenient, cache)
+        if lenient and field.is_required():
+            default = _empty_default(annotation)
+        else:
+            default = ... if field.is_required() else field
+        if lenient and name not in skip:
+            annotation = _null_as_empty(annotation)
+        if annotation is not field.annotation or (lenient and field.is_required()):
+            overrides[name] = (annotation, default)
+    cleaned = create_model(model.__name__, __base__=model, __module__=model.__module__, **overrides)
+    cache[model] = cleaned
+    return cleaned
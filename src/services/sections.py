@@ -0,0 +1,50 @@
+from src.services.llm_cache import make_cache_key
+
+# Which profile fields feed each section, and which enhancement keys it produces.
+# contact rides along with summary: both come from the Basic tab.
+SECTION_INPUTS = {
+    "summary": ("name", "email", "phone", "linkedin", "github", "summary"),
+    "education": ("education",),
+    "experience": ("experience",),
+    "projects": ("projects",),
+    "skills": ("skills",),
+    "certifications": ("certifications",),
+}
+
+SECTION_OUTPUTS = {
+    "summary": ("contact", "summary"),
+    "education": ("education",),
+    "experience": ("experience",),
+    "projects": ("projects",),
+    "skills": ("skills", "technical_skills", "soft_skills"),
+    "certifications": ("certifications",),
+}
+
+
+def section_keys(profile: dict, job_description: str, *salt) -> dict:
+    """
+    {section: cache key}. A key changes only when that section's own inputs,
+    the job description or `salt` (model, prompt) change.
+    """
+    jd_hash = make_cache_key(job_description)
+    return {
+        name: make_cache_key("section", name, *salt, jd_hash, {f: profile.get(f) for f in fields})
+        for name, fields in SECTION_INPUTS.items()
+    }
+
+
+def split_sections(enhanced: dict) -> dict:
+    """Full enhancement dict -> {section: {output key: value}}, only for complete sections."""
+    return {
+        name: {k: enhanced[k] for k in keys}
+        for name, keys in SECTION_OUTPUTS.items()
+        if all(k in enhanced for k in keys)
+    }
+
+
+def merge_sections(outputs: dict) -> dict:
+    """{section: {output key: value}} -> full enhancement dict, in schema order."""
+    merged = {}
+    for name in SECTION_OUTPUTS:
+        merged.update(outputs.get(name) or {})
+    return merged
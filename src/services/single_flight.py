@@ -0,0 +1,48 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical async calls.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it is still running await the same task instead of starting their
+    own. A caller that gets cancelled (client disconnect) does not cancel the
+    shared task for the others.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+
+        # Counters
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn):
+        """Run `fn()` (a coroutine function) once per key at a time and share its result."""
+        self.calls += 1
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        task = self._inflight.get(flight_key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executed += 1
+            task = loop.create_task(fn())
+            self._inflight[flight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+
+# Shared instance for OpenRouter calls
+llm_flights = SingleFlight()
@@ -0,0 +1,251 @@
+"""
+Static site of many portfolios, rebuilt incrementally.
+
+    python -m src.services.site_builder portfolios/ --out site/ [--workers N] [--precompress] [--force]
+    python -m src.services.site_builder portfolios.jsonl --out site/
+
+Input is a directory of *.json files (the file name is the page slug) or a
+JSONL file (slug from a "slug" key, else the hero name). Each record is the
+dict app.py's build_portfolio_data returns. The site gets one
+<slug>/index.html per portfolio, shared fingerprinted assets under assets/,
+an index.html and a manifest.json of input hashes: only portfolios whose
+data (or the templates) changed are re-rendered.
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.services.compress import minify_html
+from src.services.portfolio import (
+    ASSET_FILES,
+    TEMPLATES_FINGERPRINT,
+    export_assets,
+    generate_portfolio_html,
+    generate_site_index_html,
+)
+from src.services.render_cache import render_key
+
+# Site build settings (override through environment variables)
+SITE_BUILD_WORKERS = int(os.getenv("SITE_BUILD_WORKERS", str(os.cpu_count() or 1)))
+
+MANIFEST_NAME = "manifest.json"
+ASSETS_DIR = "assets"
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def slugify(text: str) -> str:
+    return _SLUG_RE.sub("-", str(text or "").lower()).strip("-") or "portfolio"
+
+
+def load_portfolios(source: str, on_error=None) -> dict:
+    """
+    {slug: portfolio dict} from a directory of JSON files or a JSONL file. Duplicate slugs get -2, -3...
+    Malformed JSON and records that are not objects are skipped and go to on_error(where, error),
+    `where` being the file's slug or "line <n>".
+    """
+    def skip(where, error):
+        if on_error is not None:
+            on_error(where, error)
+
+    records = []
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(".json"):
+                slug = slugify(name[:-5])
+                try:
+                    with open(os.path.join(source, name), encoding="utf-8") as f:
+                        data = json.load(f)
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    skip(slug, f"{type(e).__name__}: {e}")
+                    continue
+                if not isinstance(data, dict):
+                    skip(slug, f"expected a JSON object, got {type(data).__name__}")
+                    continue
+                records.append((slug, data))
+    else:
+        with open(source, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    skip(f"line {line_no}", f"{type(e).__name__}: {e}")
+                    continue
+                if not isinstance(data, dict):
+                    skip(f"line {line_no}", f"expected a JSON object, got {type(data).__name__}")
+                    continue
+                records.append((slugify(data.get("slug") or data.get("hero_name")), data))
+
+    portfolios = {}
+    for slug, data in records:
+        unique, n = slug, 1
+        while unique in portfolios:
+            n += 1
+            unique = f"{slug}-{n}"
+        portfolios[unique] = data
+    return portfolios
+
+
+def page_hash(data: dict) -> str:
+    """Input hash of one page: the portfolio data plus everything the templates contribute."""
+    return render_key("portfolio-page", data, template=TEMPLATES_FINGERPRINT)
+
+
+def _write(path: str, content: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+def build_page(out_dir: str, slug: str, data: dict, precompress: bool = False) -> int:
+    """Renders one portfolio into <out_dir>/<slug>/index.html (+ .gz). Returns bytes written."""
+    assets = export_assets(os.path.join(out_dir, ASSETS_DIR), base_url=f"../{ASSETS_DIR}/")
+    html = minify_html(generate_portfolio_html(data, assets=assets)).encode("utf-8")
+    path = os.path.join(out_dir, slug, "index.html")
+    _write(path, html)
+    written = len(html)
+    if precompress:
+        encoded = gzip.compress(html, compresslevel=9, mtime=0)
+        _write(path + ".gz", encoded)
+        written += len(encoded)
+    return written
+
+
+def _prune(out_dir: str, removed: list):
+    for slug in removed:
+        for name in ("index.html", "index.html.gz"):
+            path = os.path.join(out_dir, slug, name)
+            if os.path.exists(path):
+                os.remove(path)
+        try:
+            os.rmdir(os.path.join(out_dir, slug))
+        except OSError:
+            pass  # not empty: something else lives there too
+    # Assets from older template versions
+    assets_dir = os.path.join(out_dir, ASSETS_DIR)
+    for name in os.listdir(assets_dir):
+        if name not in ASSET_FILES:
+            os.remove(os.path.join(assets_dir, name))
+
+
+def build_site(source: str, out_dir: str, workers: int = SITE_BUILD_WORKERS, precompress: bool = False,
+               force: bool = False, on_error=None) -> dict:
+    """Builds or updates the site in `out_dir` and returns build stats."""
+    started = time.perf_counter()
+    skipped = []
+
+    def skip(where, error):
+        skipped.append(where)
+        if on_error is not None:
+            on_error(where, error)
+
+    portfolios = load_portfolios(source, skip)
+
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    previous = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f).get("pages", {})
+
+    export_assets(os.path.join(out_dir, ASSETS_DIR))
+    pages = {}
+    todo = []
+    for slug, data in portfolios.items():
+        entry = {
+            "hash": page_hash(data),
+            "name": data.get("hero_name") or slug,
+            "title": data.get("hero_title") or "",
+        }
+        pages[slug] = entry
+        old = previous.get(slug)
+        page = os.path.join(out_dir, slug, "index.html")
+        if (old is None or old["hash"] != entry["hash"] or not os.path.exists(page)
+                or (precompress and not os.path.exists(page + ".gz"))):
+            todo.append(slug)
+
+    failed = []
+    total_bytes = 0
+    if len(todo) > 1 and workers > 1:
+        with ProcessPoolExecutor(min(workers, len(todo))) as pool:
+            futures = {pool.submit(build_page, out_dir, slug, portfolios[slug], precompress): slug for slug in todo}
+            for future in as_completed(futures):
+                slug = futures[future]
+                try:
+                    total_bytes += future.result()
+                except Exception as e:
+                    failed.append(slug)
+                    if on_error is not None:
+                        on_error(slug, f"{type(e).__name__}: {e}")
+    else:
+        for slug in todo:
+            try:
+                total_bytes += build_page(out_dir, slug, portfolios[slug], precompress)
+            except Exception as e:
+                failed.append(slug)
+                if on_error is not None:
+                    on_error(slug, f"{type(e).__name__}: {e}")
+
+    # Failed pages stay out of the manifest so the next build retries them
+    for slug in failed:
+        del pages[slug]
+    # A page whose input file is unreadable keeps its last good build
+    for slug in skipped:
+        if slug in previous:
+            pages[slug] = previous[slug]
+    removed = [slug for slug in previous if slug not in portfolios and slug not in pages]
+    _prune(out_dir, removed)
+
+    index = generate_site_index_html(
+        [{"href": f"{slug}/", "name": p["name"], "title": p["title"]} for slug, p in sorted(pages.items())],
+        assets=export_assets(os.path.join(out_dir, ASSETS_DIR), base_url=f"{ASSETS_DIR}/"),
+    )
+    _write(os.path.join(out_dir, "index.html"), minify_html(index).encode("utf-8"))
+    _write(manifest_path, json.dumps({"templates": TEMPLATES_FINGERPRINT, "pages": pages}, indent=1).encode("utf-8"))
+
+    elapsed = time.perf_counter() - started
+    rebuilt = len(todo) - len(failed)
+    return {
+        "pages": len(pages),
+        "rebuilt": rebuilt,
+        "unchanged": len(portfolios) - len(todo),
+        "removed": len(removed),
+        "failed": len(failed),
+        "skipped": len(skipped),
+        "bytes_written": total_bytes,
+        "seconds": round(elapsed, 3),
+        "pages_per_sec": round(rebuilt / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a static site of portfolios, re-rendering only what changed.")
+    parser.add_argument("input", help="directory of <slug>.json files, or a JSONL file")
+    parser.add_argument("--out", required=True, help="site output directory")
+    parser.add_argument("--workers", type=int, default=SITE_BUILD_WORKERS)
+    parser.add_argument("--precompress", action="store_true", help="also write index.html.gz next to each page")
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and rebuild every page")
+    args = parser.parse_args(argv)
+
+    def report_error(where, error):
+        print(f"{where}: {error}", file=sys.stderr)
+
+    stats = build_site(args.input, args.out, args.workers, args.precompress, args.force, report_error)
+    print(
+        f"{stats['pages']} pages: {stats['rebuilt']} rebuilt, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed, {stats['failed']} failed, {stats['skipped']} skipped in {stats['seconds']}s "
+        f"({stats['pages_per_sec']} pages/sec) -> {args.out}"
+    )
+    return 1 if stats["failed"] or stats["skipped"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
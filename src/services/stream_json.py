@@ -0,0 +1,136 @@
+import json
+
+
+class IncrementalJSONObject:
+    """
+    Incremental parser for a JSON object that arrives in chunks (LLM token stream).
+
+    `feed()` returns the pieces completed by the new text as (key, index, value)
+    tuples:
+      - (key, i, value)   element i of a top-level array finished
+      - (key, None, value) the whole value of a top-level key finished
+
+    Anything before the first "{" (```json fences, chatter) is ignored. Values
+    are decoded with json.loads once their closing character has been seen, so
+    a section is never emitted half-written.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self.depth = 0
+        self.done = False
+
+        self._in_str = False
+        self._escape = False
+        self._str_start = None
+
+        self._expect = "key"  # key | colon | value | comma (at depth 1)
+        self._key = None
+        self._val_start = None
+        self._in_array = False
+        self._elem_start = None
+        self._index = 0
+
+    @property
+    def text(self) -> str:
+        return self._buf
+
+    def feed(self, chunk: str) -> list:
+        self._buf += chunk
+        events = []
+        buf = self._buf
+
+        for i in range(self._pos, len(buf)):
+            if self.done:
+                break
+            ch = buf[i]
+
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+                    self._close_string(i, events)
+                continue
+
+            if self.depth == 0:
+                if ch == "{":
+                    self.depth = 1
+                continue
+
+            if ch in " \t\r\n":
+                continue
+
+            if ch == '"':
+                self._in_str = True
+                self._str_start = i
+                self._mark_value_start(i)
+            elif ch in "{[":
+                if self.depth == 1 and self._expect == "value":
+                    self._val_start = i
+                    self._in_array = ch == "["
+                    self._index = 0
+                else:
+                    self._mark_value_start(i)
+                self.depth += 1
+            elif ch in "}]":
+                # Scalar values end at the closing bracket of their container
+                if self.depth == 2 and self._in_array and self._elem_start is not None:
+                    self._emit_element(buf[self._elem_start:i], events)
+                elif self.depth == 1 and self._val_start is not None:
+                    self._emit_field(buf[self._val_start:i], events)
+
+                self.depth -= 1
+                if self.depth == 2 and self._in_array and self._elem_start is not None:
+                    self._emit_element(buf[self._elem_start:i + 1], events)
+                elif self.depth == 1 and self._val_start is not None:
+                    self._emit_field(buf[self._val_start:i + 1], events)
+                elif self.depth == 0:
+                    self.done = True
+            elif ch == ",":
+                if self.depth == 2 and self._in_array and self._elem_start is not None:
+                    self._emit_element(buf[self._elem_start:i], events)
+                elif self.depth == 1:
+                    if self._val_start is not None:
+                        self._emit_field(buf[self._val_start:i], events)
+                    self._expect = "key"
+            elif ch == ":":
+                if self.depth == 1:
+                    self._expect = "value"
+            else:
+                # Start of a number / true / false / null
+                self._mark_value_start(i)
+
+        self._pos = len(buf)
+        return events
+
+    def _mark_value_start(self, i: int):
+        if self.depth == 1 and self._expect == "value" and self._val_start is None:
+            self._val_start = i
+            self._in_array = False
+        elif self.depth == 2 and self._in_array and self._elem_start is None:
+            self._elem_start = i
+
+    def _close_string(self, i: int, events: list):
+        if self.depth == 1:
+            if self._expect == "key":
+                self._key = json.loads(self._buf[self._str_start:i + 1])
+                self._expect = "colon"
+            elif self._val_start == self._str_start:
+                self._emit_field(self._buf[self._val_start:i + 1], events)
+        elif self.depth == 2 and self._in_array and self._elem_start == self._str_start:
+            self._emit_element(self._buf[self._elem_start:i + 1], events)
+
+    def _emit_element(self, raw: str, events: list):
+        events.append((self._key, self._index, json.loads(raw)))
+        self._elem_start = None
+        self._index += 1
+
+    def _emit_field(self, raw: str, events: list):
+        events.append((self._key, None, json.loads(raw)))
+        self._val_start = None
+        self._in_array = False
+        self._expect = "comma"